@@ -1 +1,5 @@
- 
+# app/__init__.py
+from dotenv import load_dotenv
+
+# Load environment variables from .env before any module reads its settings
+load_dotenv()
@@ -0,0 +1,143 @@
+# app/agents/context_builder.py
+import os
+import re
+import json
+
+from app.services.repo_ranking import rank_repos
+
+# Tokens available for the resume and GitHub sections of the evaluator prompt together.
+EVALUATION_TOKEN_BUDGET = int(os.getenv("EVALUATION_TOKEN_BUDGET", "6000"))
+# Share of the budget the resume may take; GitHub data gets the rest (and whatever the resume leaves).
+RESUME_BUDGET_SHARE = float(os.getenv("RESUME_BUDGET_SHARE", "0.4"))
+# Longest README excerpt included per repository.
+README_EXCERPT_TOKENS = int(os.getenv("README_EXCERPT_TOKENS", "250"))
+
+_encoding = None
+
+
+def _get_encoding():
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")  # gpt-4o family
+        except Exception as e:
+            print(f"Warning: tiktoken unavailable ({e}). Estimating token counts from text length.")
+            _encoding = False
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if not encoding:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cuts text down to at most `max_tokens` tokens, marking the cut with an ellipsis."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if not encoding:
+        return text if len(text) <= max_tokens * 4 else text[: max_tokens * 4] + "…"
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]) + "…"
+
+
+def compact_json(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def excerpt_readme(readme: str | None, max_tokens: int = README_EXCERPT_TOKENS) -> str | None:
+    """The opening of a README without badges, images, HTML and extra whitespace."""
+    if not readme:
+        return None
+    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", " ", readme)       # images and badges
+    text = re.sub(r"<[^>]+>", " ", text)                      # inline HTML
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)      # links -> their text
+    text = re.sub(r"\s+", " ", text).strip()
+    return truncate_tokens(text, max_tokens) or None
+
+
+def _compact_project(project: dict, with_readme: bool) -> dict:
+    entry = {
+        "name": project.get("name"),
+        "language": project.get("language"),
+        "stars": project.get("stars"),
+        "description": project.get("description"),
+    }
+    if project.get("fork"):
+        entry["fork"] = True
+    if project.get("pushed_at"):
+        entry["pushed_at"] = project["pushed_at"][:10]
+    commits = [
+        (commit.get("message") or "").splitlines()[0][:100]
+        for commit in project.get("recent_commits") or []
+        if commit.get("message")
+    ]
+    if commits:
+        entry["recent_commits"] = commits
+    if with_readme:
+        readme = project.get("readme_excerpt") or excerpt_readme(project.get("readme_content"))
+        if readme:
+            entry["readme_excerpt"] = readme
+    return {key: value for key, value in entry.items() if value not in (None, "", [])}
+
+
+def _fit_resume(resume_data: dict, max_tokens: int) -> tuple[str, int]:
+    text = compact_json(resume_data)
+    tokens = count_tokens(text)
+    if tokens <= max_tokens:
+        return text, tokens
+    text = truncate_tokens(text, max_tokens)
+    return text, count_tokens(text)
+
+
+def _fit_github(github_data: dict, job_description: str, max_tokens: int) -> tuple[str, int, int]:
+    """Adds repositories in order of relevance while they fit; READMEs are dropped before repos are."""
+    if not github_data or "projects" not in github_data:
+        text = compact_json(github_data or {})
+        return text, count_tokens(text), 0
+
+    profile = {key: value for key, value in github_data.items() if key != "projects"}
+    used = count_tokens(compact_json({**profile, "projects": []}))
+    projects = []
+    for project in rank_repos(github_data.get("projects") or [], job_description):
+        for with_readme in (True, False):
+            entry = _compact_project(project, with_readme)
+            # +1 for the separating comma
+            cost = count_tokens(compact_json(entry)) + 1
+            if used + cost <= max_tokens:
+                projects.append(entry)
+                used += cost
+                break
+        else:
+            # Not even the bare entry fits; less relevant repos would not add much either.
+            break
+
+    text = compact_json({**profile, "projects": projects})
+    return text, count_tokens(text), len(projects)
+
+
+def build_evaluation_context(job_description: str, resume_data: dict, github_data: dict, budget: int = EVALUATION_TOKEN_BUDGET) -> dict:
+    """
+    Serializes the resume and GitHub data for the evaluator within a token budget.
+    Repositories are ranked by relevance to the job, stars and recency, and included with
+    short README excerpts until the budget is used up.
+    """
+    resume_text, resume_tokens = _fit_resume(resume_data or {}, int(budget * RESUME_BUDGET_SHARE))
+    github_text, github_tokens, repos_included = _fit_github(github_data, job_description, budget - resume_tokens)
+    return {
+        "resume_data": resume_text,
+        "github_data": github_text,
+        "stats": {
+            "budget": budget,
+            "resume_tokens": resume_tokens,
+            "github_tokens": github_tokens,
+            "repos_included": repos_included,
+            "repos_total": len((github_data or {}).get("projects") or []),
+        },
+    }
@@ -1,15 +1,18 @@
 # app/agents/evaluator.py
 import os
 import json
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from app.agents.llm import get_llm, get_prompt
+from app.agents.llm_cache import invoke_cached, discard_cached
+from app.agents.context_builder import build_evaluation_context, count_tokens
 
-# Initialize the LLM (using the same model as the resume parser)
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+# "single" evaluates every candidate in its own call; "batched" packs several candidates
+# into one call that shares a single copy of the job description and instructions.
+EVALUATION_MODE = os.getenv("EVALUATION_MODE", "single")
+# Upper bound for the prompt of one batched call; batches are packed up to it.
+EVALUATION_BATCH_TOKEN_BUDGET = int(os.getenv("EVALUATION_BATCH_TOKEN_BUDGET", "32000"))
+# Most candidates evaluated in one batched call (bounds the size of the answer as well).
+EVALUATION_BATCH_MAX = int(os.getenv("EVALUATION_BATCH_MAX", "8"))
 
 # --- UPDATED PROMPT: Now includes structured output for strengths and weaknesses ---
 template = """
@@ -25,7 +28,7 @@ Here is the candidate's resume data (parsed into JSON):
 {resume_data}
 ---
 
-Here is the candidate's GitHub profile data (parsed into JSON). Pay close attention to the 'readme_content' and 'recent_commits' for each project to form a holistic view:
+Here is the candidate's GitHub profile data (parsed into JSON, most relevant projects first). Pay close attention to the 'readme_excerpt' and 'recent_commits' for each project to form a holistic view:
 ---
 {github_data}
 ---
@@ -55,29 +58,37 @@ Expected JSON Format:
 }}
 """
 
-prompt = PromptTemplate(
-    input_variables=["job_description", "resume_data", "github_data"],
-    template=template
-)
-
-def evaluate_candidate(job_description: str, resume_data: dict, github_data: dict) -> dict:
+def evaluate_candidate(job_description: str, resume_data: dict, github_data: dict, report: dict | None = None) -> dict:
     """
     Evaluates a candidate based on multiple data sources and provides a score and explanation.
+    The resume and GitHub data are fitted into EVALUATION_TOKEN_BUDGET tokens; if `report` is
+    given, it receives the token counts of the prompt.
     """
-    chain = prompt | llm
-    
+    context = build_evaluation_context(job_description, resume_data, github_data)
+
     # Prepare the input for the chain
     input_data = {
         "job_description": job_description,
-        "resume_data": str(resume_data),
-        "github_data": str(github_data)
+        "resume_data": context["resume_data"],
+        "github_data": context["github_data"]
     }
+    prompt = get_prompt(template)
+    llm = get_llm()
+    input_tokens = count_tokens(prompt.format(**input_data))
+    stats = context["stats"]
+    print(
+        f"Evaluator input: {input_tokens} tokens "
+        f"({stats['repos_included']}/{stats['repos_total']} repos within a budget of {stats['budget']})."
+    )
+    if report is not None:
+        report.update(stats, input_tokens=input_tokens)
+    content = ""
     
     try:
-        response = chain.invoke(input_data)
+        content = invoke_cached(prompt, llm, input_data)
         
         # FIX: Clean the LLM response before parsing
-        clean_response = response.content.strip()
+        clean_response = content.strip()
         if clean_response.startswith("```json"):
             clean_response = clean_response[7:]
         if clean_response.endswith("```"):
@@ -87,12 +98,154 @@ def evaluate_candidate(job_description: str, resume_data: dict, github_data: dic
     
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON from LLM: {e}")
-        print(f"LLM response was: {response.content}")
+        print(f"LLM response was: {content}")
+        # Don't keep serving a broken answer from the cache
+        discard_cached(prompt, llm, input_data)
+        return {}
+    except Exception as e:
+        print(f"An unexpected error occurred in LLM invocation: {e}")
+        return {}
+
+
+
+# --- Batched evaluation: one job description, several candidates per call ---
+batch_template = """
+You are an expert technical recruiter. Your task is to evaluate several candidates for the same job, each based on their resume and a deep dive into their GitHub profile. Evaluate every candidate independently of the others.
+
+Here is the job description:
+---
+{job_description}
+---
+
+Here are the candidates. Each one has a candidate_id, resume data and GitHub profile data (parsed into JSON, most relevant projects first):
+---
+{candidates}
+---
+
+Follow these instructions carefully for EVERY candidate:
+1.  Provide a score from 1 to 10 for the candidate's fit for the role.
+2.  The explanation must be structured into two sections: 'strengths' and 'weaknesses'.
+3.  List the candidate's key strengths in an array of bullet points, citing specific examples from their resume (e.g., project names, skills) and GitHub profile (e.g., repository names, languages used, stars) to justify their score.
+4.  List the candidate's key weaknesses in an array of bullet points, explaining any gaps in their experience or skills relative to the job description.
+5.  If no GitHub data is available for a candidate, mention that in their weaknesses section.
+6.  The output MUST be a single, valid JSON object keyed by candidate_id, with one entry for each candidate, and NOTHING else. Do not include any text, conversation, or markdown code blocks outside the JSON.
+
+Expected JSON Format:
+{{
+    "<candidate_id>": {{
+        "candidate_name": "Full Name",
+        "score": 8,
+        "explanation": {{
+            "strengths": ["Strength 1", "Strength 2"],
+            "weaknesses": ["Weakness 1", "Weakness 2"]
+        }}
+    }}
+}}
+"""
+
+
+def _candidate_section(candidate_id: str, context: dict) -> str:
+    return (
+        f"### candidate_id: {candidate_id}\n"
+        f"Resume data: {context['resume_data']}\n"
+        f"GitHub data: {context['github_data']}\n"
+    )
+
+
+def _pack_batches(sections: list[tuple[str, str, int]], prefix_tokens: int) -> list[list[tuple[str, str, int]]]:
+    """Greedily groups (candidate_id, section, tokens) into batches that fit the batch budget."""
+    batches, current, used = [], [], prefix_tokens
+    for section in sections:
+        if current and (used + section[2] > EVALUATION_BATCH_TOKEN_BUDGET or len(current) >= EVALUATION_BATCH_MAX):
+            batches.append(current)
+            current, used = [], prefix_tokens
+        current.append(section)
+        used += section[2]
+    if current:
+        batches.append(current)
+    return batches
+
+
+def evaluate_candidates_batch(job_description: str, candidates: list[dict], reports: dict | None = None) -> dict:
+    """
+    Evaluates several candidates for one job description, given as dicts with candidate_id,
+    resume_data and github_data. Candidates are packed into as few calls as the batch token
+    budget allows. Returns the evaluations keyed by candidate_id; candidates missing from a
+    batched answer are evaluated on their own. `reports` (keyed by candidate_id) receive the
+    token counts, with the shared prompt split evenly over the batch.
+    """
+    reports = reports or {}
+    contexts = {}
+    sections = []
+    for candidate in candidates:
+        candidate_id = candidate["candidate_id"]
+        contexts[candidate_id] = build_evaluation_context(job_description, candidate["resume_data"], candidate["github_data"])
+        section = _candidate_section(candidate_id, contexts[candidate_id])
+        sections.append((candidate_id, section, count_tokens(section)))
+
+    prefix_tokens = count_tokens(get_prompt(batch_template).format(job_description=job_description, candidates=""))
+    by_id = {candidate["candidate_id"]: candidate for candidate in candidates}
+    evaluations = {}
+    for batch in _pack_batches(sections, prefix_tokens):
+        if len(batch) > 1:
+            evaluations.update(_evaluate_batch(job_description, batch, prefix_tokens, contexts, reports))
+
+        # Single candidates and whatever a batched answer left out
+        for candidate_id, _, _ in batch:
+            if candidate_id not in evaluations:
+                candidate = by_id[candidate_id]
+                evaluations[candidate_id] = evaluate_candidate(
+                    job_description, candidate["resume_data"], candidate["github_data"], report=reports.get(candidate_id)
+                )
+    return evaluations
+
+
+def _evaluate_batch(job_description: str, batch: list[tuple[str, str, int]], prefix_tokens: int, contexts: dict, reports: dict) -> dict:
+    input_data = {
+        "job_description": job_description,
+        "candidates": "\n".join(section for _, section, _ in batch)
+    }
+    batch_tokens = prefix_tokens + sum(tokens for _, _, tokens in batch)
+    batch_prompt = get_prompt(batch_template)
+    llm = get_llm()
+    print(f"Evaluator input: {batch_tokens} tokens for a batch of {len(batch)} candidates.")
+    content = ""
+
+    try:
+        content = invoke_cached(batch_prompt, llm, input_data)
+
+        clean_response = content.strip()
+        if clean_response.startswith("```json"):
+            clean_response = clean_response[7:]
+        if clean_response.endswith("```"):
+            clean_response = clean_response[:-3]
+        answer = json.loads(clean_response)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON from LLM: {e}")
+        print(f"LLM response was: {content}")
+        discard_cached(batch_prompt, llm, input_data)
         return {}
     except Exception as e:
         print(f"An unexpected error occurred in LLM invocation: {e}")
         return {}
 
+    evaluations = {}
+    for candidate_id, _, tokens in batch:
+        evaluation = answer.get(candidate_id) if isinstance(answer, dict) else None
+        if not isinstance(evaluation, dict) or "score" not in evaluation:
+            print(f"Warning: Candidate {candidate_id} is missing from the batched evaluation.")
+            continue
+        evaluations[candidate_id] = evaluation
+        report = reports.get(candidate_id)
+        if report is not None:
+            report.update(
+                contexts[candidate_id]["stats"],
+                input_tokens=tokens + round(prefix_tokens / len(batch)),
+                batch_size=len(batch),
+                batch_input_tokens=batch_tokens,
+            )
+    return evaluations
+
 
 # # app/agents/evaluator.py
 # import os
@@ -0,0 +1,35 @@
+# app/agents/llm.py
+# Shared chat model clients and prompt templates, built on first use. LangChain and the OpenAI
+# SDK are only imported then, so importing the app (uvicorn workers, --reload) stays fast,
+# and all agents share one client (and its HTTP connection pool) per model.
+import threading
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+_llms = {}
+_prompts = {}
+_lock = threading.Lock()
+
+
+def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0):
+    """The shared ChatOpenAI client for `model` and `temperature`."""
+    key = (model, temperature)
+    llm = _llms.get(key)
+    if llm is None:
+        with _lock:
+            llm = _llms.get(key)
+            if llm is None:
+                from langchain_openai import ChatOpenAI
+
+                llm = _llms[key] = ChatOpenAI(model=model, temperature=temperature)
+    return llm
+
+
+def get_prompt(template: str):
+    """The PromptTemplate for `template` (input variables are taken from its {placeholders})."""
+    prompt = _prompts.get(template)
+    if prompt is None:
+        from langchain_core.prompts import PromptTemplate
+
+        prompt = _prompts.setdefault(template, PromptTemplate.from_template(template))
+    return prompt
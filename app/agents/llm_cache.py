@@ -0,0 +1,137 @@
+# app/agents/llm_cache.py
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from app.services.sqlite_cache import CACHE_DIR, SQLiteCache
+from app.services.metrics import record_llm_call
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm_responses.sqlite"))
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "1024"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache for LLM completions: an in-memory LRU in front of a persistent SQLite store.
+    With temperature=0 the same model, prompt template and inputs give the same answer, so the
+    key is built from exactly those three.
+    """
+
+    def __init__(self, store: SQLiteCache, memory_entries: int = LLM_CACHE_MEMORY_ENTRIES, ttl: int = LLM_CACHE_TTL):
+        self.store = store
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, template: str, inputs: dict) -> str:
+        template_version = hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+        canonical_inputs = json.dumps(inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        input_hash = hashlib.sha256(canonical_inputs.encode("utf-8")).hexdigest()
+        return f"{model}:{template_version}:{input_hash}"
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[1] > now:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[0]
+            self._memory.pop(key, None)
+
+        value = self.store.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+        content = value.decode("utf-8")
+        # The disk store does not hand out the remaining TTL, so keep it in memory for a full TTL at most.
+        self._remember(key, content, now + self.ttl)
+        self.stats["disk_hits"] += 1
+        return content
+
+    def set(self, key: str, content: str):
+        self._remember(key, content, time.time() + self.ttl)
+        self.store.set(key, content.encode("utf-8"), ttl=self.ttl)
+
+    def discard(self, key: str):
+        with self._lock:
+            self._memory.pop(key, None)
+        self.store.delete(key)
+
+    def _remember(self, key: str, content: str, expires_at: float):
+        with self._lock:
+            self._memory[key] = (content, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def info(self) -> dict:
+        lookups = sum(self.stats.values())
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        return {
+            **self.stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "store": self.store.info(),
+        }
+
+
+_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Returns the process-wide LLM response cache, or None when it is disabled."""
+    global _cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = LLMResponseCache(SQLiteCache(LLM_CACHE_PATH, LLM_CACHE_MAX_MB * 1024 * 1024))
+    return _cache
+
+
+def _cache_key(prompt, llm, inputs: dict) -> str:
+    model = f"{llm.model_name}@{llm.temperature}"
+    return LLMResponseCache.make_key(model, prompt.template, inputs)
+
+
+def _invoke(chain, inputs: dict) -> str:
+    response = chain.invoke(inputs)
+    # Token counts reported by the API, for the metrics of the current stage and candidate
+    record_llm_call(getattr(response, "usage_metadata", None), cached=False)
+    return response.content
+
+
+def invoke_cached(prompt, llm, inputs: dict) -> str:
+    """
+    Runs `prompt | llm` on the inputs and returns the response text.
+    Identical calls are answered from the cache instead of the model.
+    """
+    chain = prompt | llm
+    cache = get_llm_cache()
+    if cache is None:
+        return _invoke(chain, inputs)
+
+    key = _cache_key(prompt, llm, inputs)
+    content = cache.get(key)
+    if content is None:
+        content = _invoke(chain, inputs)
+        cache.set(key, content)
+    else:
+        record_llm_call(None, cached=True)
+    return content
+
+
+def discard_cached(prompt, llm, inputs: dict):
+    """Drops a cached response, e.g. when it turned out not to be valid JSON."""
+    cache = get_llm_cache()
+    if cache is not None:
+        cache.discard(_cache_key(prompt, llm, inputs))
@@ -2,15 +2,13 @@
 import os
 import json
 import re
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+from app.agents.llm import get_llm, get_prompt
+from app.agents.llm_cache import invoke_cached, discard_cached
 
-# Initialize the LLM
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+# "unified": one LLM call parses the resume and resolves the GitHub handle.
+# "two_pass": the original flow with a separate find_github_url_with_llm call.
+RESUME_EXTRACTION_MODE = os.getenv("RESUME_EXTRACTION_MODE", "unified").lower()
 
 # Define the prompt template for resume parsing
 template = """
@@ -63,25 +61,40 @@ Expected JSON Format:
 }}
 """
 
-prompt = PromptTemplate(
-    input_variables=["resume_text"],
-    template=template
+# Unified extraction: the same call also resolves the canonical GitHub handle,
+# which makes the separate find_github_url_with_llm call unnecessary.
+unified_template = template.replace(
+    "- If a piece of information is not available, use null or an empty array.",
+    """- For the github_username, give only the candidate's GitHub handle (letters, digits and hyphens; no URL, no spaces). Take it from a GitHub link or from a handle clearly labelled as GitHub, and strip any surrounding noise (e.g. '/gtbpriyanshujhaa' becomes 'priyanshujhaa'). If there is none, use null.
+- For the github_confidence, give a number between 0 and 1 saying how sure you are that github_username is the candidate's own GitHub profile.
+- If a piece of information is not available, use null or an empty array.""",
+).replace(
+    '''"github_url": "https://github.com/username" or "username",''',
+    '''"github_url": "https://github.com/username" or "username",
+    "github_username": "username",
+    "github_confidence": 0.9,''',
 )
 
-def parse_resume(resume_text: str) -> dict:
+GITHUB_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$')
+
+def parse_resume(resume_text: str, unified: bool = False) -> dict:
     """
     Parses a resume's text and returns a structured JSON object.
+    With `unified=True` the result also holds a validated `github_username` and its `github_confidence`.
     """
     if not resume_text:
         return {}
 
-    chain = prompt | llm
+    active_prompt = get_prompt(unified_template if unified else template)
+    llm = get_llm()
+    inputs = {"resume_text": resume_text}
+    content = ""
     
     try:
-        response = chain.invoke({"resume_text": resume_text})
+        content = invoke_cached(active_prompt, llm, inputs)
         
         # Clean up the markdown block
-        clean_response = response.content.strip()
+        clean_response = content.strip()
         if clean_response.startswith("```json"):
             clean_response = clean_response[7:]
         if clean_response.endswith("```"):
@@ -101,18 +114,41 @@ def parse_resume(resume_text: str) -> dict:
             else:
                 # If it's not a full URL, but just a username, reconstruct it
                 parsed_data['github_url'] = f"https://github.com/{raw_github_url}"
+
+        if unified:
+            _normalize_github_handle(parsed_data)
         
         return parsed_data
 
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON from LLM: {e}")
-        print(f"LLM response was: {response.content}")
+        print(f"LLM response was: {content}")
+        # Don't keep serving a broken answer from the cache
+        discard_cached(active_prompt, llm, inputs)
         return {}
     except Exception as e:
         print(f"An unexpected error occurred in LLM invocation: {e}")
         return {}
 
 
+def _normalize_github_handle(parsed_data: dict):
+    """Validates the handle of a unified extraction, falling back to the one in github_url."""
+    username = (parsed_data.get('github_username') or "").strip().strip('/@')
+    if not GITHUB_USERNAME_PATTERN.match(username):
+        username = ""
+        match = re.search(r'github.com/([\w-]+)', parsed_data.get('github_url') or "", re.IGNORECASE)
+        if match and GITHUB_USERNAME_PATTERN.match(match.group(1)):
+            username = match.group(1)
+    try:
+        # A handle without a stated (or a readable) confidence is not trusted
+        confidence = float(parsed_data.get('github_confidence') or 0.0)
+    except (TypeError, ValueError):
+        confidence = 0.0
+
+    parsed_data['github_username'] = username or None
+    parsed_data['github_confidence'] = min(max(confidence, 0.0), 1.0) if username else 0.0
+
+
 
 # # app/agents/resume_parser.py
 # import os
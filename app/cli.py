@@ -0,0 +1,230 @@
+# app/cli.py
+# Headless bulk screening of a folder of resume PDFs, with a checkpoint file so an interrupted
+# run only screens the unfinished resumes when it is started again.
+#
+#   python -m app.cli job_description.txt resumes/ --concurrency 16
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+
+from app.services.screening import iter_screen_resumes, start_job, SCREEN_CONCURRENCY
+from app.services.candidate_store import get_candidate_store
+from app.services.github_client import close_github_client
+from app.services.pdf_extractor import shutdown_pdf_pool, PDF_WORKERS
+
+
+def find_resumes(resume_dir: str) -> list[str]:
+    """All PDFs below `resume_dir`, as sorted paths relative to it."""
+    paths = []
+    for root, dirs, files in os.walk(resume_dir):
+        dirs[:] = [name for name in dirs if not name.startswith(".")]
+        for name in files:
+            if name.lower().endswith(".pdf") and not name.startswith("."):
+                paths.append(os.path.relpath(os.path.join(root, name), resume_dir))
+    return sorted(paths)
+
+
+def default_checkpoint_path(job_description: str, resume_dir: str) -> str:
+    """One checkpoint per (job description, resume folder) pair."""
+    key = hashlib.sha256(f"{os.path.abspath(resume_dir)}\n{job_description}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join("data_output", "checkpoints", f"{key}.jsonl")
+
+
+def load_checkpoint(path: str) -> tuple[dict | None, dict[str, dict]]:
+    """
+    Reads a checkpoint: a header line with the job, then one line per finished resume.
+    Returns (header, {relative path: latest entry}); a torn last line from a killed run is ignored.
+    """
+    if not os.path.exists(path):
+        return None, {}
+    header, finished = None, {}
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if "job_description_id" in entry and "path" not in entry:
+                header = entry
+            elif "path" in entry:
+                finished[entry["path"]] = entry
+    return header, finished
+
+
+class Checkpoint:
+    """Appends one line per finished resume and syncs it to disk, so a crash loses at most the resumes in flight."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a")
+
+    def write(self, entry: dict):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+def _read_resumes(resume_dir: str, paths: list[str]):
+    """(relative path, PDF bytes) pairs, read one file at a time as the screening asks for them."""
+    for path in paths:
+        try:
+            with open(os.path.join(resume_dir, path), "rb") as f:
+                yield path, f.read()
+        except OSError as e:
+            print(f"Warning: Could not read {path}: {e}")
+            yield path, b""
+
+
+class Progress:
+    """A live progress line on stderr (rewritten in place on a terminal, every few seconds otherwise)."""
+
+    def __init__(self, total: int, already_done: int, interval: float = 5.0):
+        self.total = total
+        self.already_done = already_done
+        self.counts = {"done": 0, "skipped": 0, "failed": 0}
+        self.started = time.perf_counter()
+        self.interactive = sys.stderr.isatty()
+        self.interval = 0.0 if self.interactive else interval
+        self._last = 0.0
+
+    def update(self, status: str, force: bool = False):
+        if status:
+            self.counts[status] += 1
+        now = time.perf_counter()
+        if not force and now - self._last < self.interval:
+            return
+        self._last = now
+        finished = sum(self.counts.values())
+        elapsed = now - self.started
+        rate = finished / elapsed if elapsed else 0.0
+        remaining = self.total - finished
+        eta = f"{remaining / rate / 60:.1f} min" if rate and remaining else "-"
+        line = (
+            f"[{self.already_done + finished}/{self.already_done + self.total}] "
+            f"{self.counts['done']} screened, {self.counts['skipped']} skipped, {self.counts['failed']} failed | "
+            f"{rate:.2f} resumes/s | ETA {eta}"
+        )
+        if self.interactive:
+            print("\r" + line, end="", file=sys.stderr, flush=True)
+        else:
+            print(line, file=sys.stderr, flush=True)
+
+    def close(self):
+        self.update("", force=True)
+        if self.interactive:
+            print(file=sys.stderr)
+
+
+async def screen_folder(
+    job_description: str,
+    resume_dir: str,
+    checkpoint_path: str,
+    concurrency: int = SCREEN_CONCURRENCY,
+    retry_failed: bool = True,
+) -> dict:
+    """
+    Screens every PDF below `resume_dir` with the same pipeline as POST /screen and records each
+    finished resume in the checkpoint. Resumes already in the checkpoint are not screened again
+    (failed ones only with `retry_failed=False`). Returns a summary of the run.
+    """
+    header, finished = load_checkpoint(checkpoint_path)
+    description_hash = hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+    if header is not None and header.get("job_description_sha256") != description_hash:
+        raise ValueError(f"{checkpoint_path} belongs to a different job description.")
+
+    checkpoint = Checkpoint(checkpoint_path)
+    if header is None:
+        job_description_id = await asyncio.to_thread(start_job, job_description)
+        checkpoint.write({"job_description_id": job_description_id, "job_description_sha256": description_hash, "resume_dir": os.path.abspath(resume_dir)})
+    else:
+        # Continue the same job, so all candidates end up together in the candidate store
+        job_description_id = header["job_description_id"]
+        os.makedirs(f"data_output/{job_description_id}", exist_ok=True)
+        await asyncio.to_thread(get_candidate_store().save_job, job_description_id, job_description)
+
+    paths = find_resumes(resume_dir)
+    done = {path for path, entry in finished.items() if entry["status"] != "failed" or not retry_failed}
+    pending = [path for path in paths if path not in done]
+    print(f"Job {job_description_id}: {len(paths)} resumes, {len(paths) - len(pending)} already finished, {len(pending)} to screen.", file=sys.stderr)
+
+    progress = Progress(len(pending), len(paths) - len(pending))
+    try:
+        async for index, candidate_data in iter_screen_resumes(
+            _read_resumes(resume_dir, pending), job_description, job_description_id, concurrency
+        ):
+            entry = {"path": pending[index], "status": "failed", "candidate_id": None, "score": None, "finished_at": time.time()}
+            if candidate_data:
+                ranking = candidate_data.get("prerank")
+                entry["status"] = "skipped" if ranking and not ranking["shortlisted"] else "done"
+                entry["candidate_id"] = candidate_data["candidate_id"]
+                entry["score"] = (candidate_data.get("final_evaluation") or {}).get("score")
+            checkpoint.write(entry)
+            progress.update(entry["status"])
+    finally:
+        progress.close()
+        checkpoint.close()
+        await close_github_client()
+        shutdown_pdf_pool()
+
+    elapsed = time.perf_counter() - progress.started
+    return {
+        "job_description_id": job_description_id,
+        "total": len(paths),
+        "previously_finished": len(paths) - len(pending),
+        **progress.counts,
+        "elapsed_seconds": round(elapsed, 1),
+        "resumes_per_second": round(sum(progress.counts.values()) / elapsed, 3) if elapsed else None,
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Screen a folder of resume PDFs against a job description.")
+    parser.add_argument("job_description", help="text file with the job description")
+    parser.add_argument("resume_dir", help="folder with the resume PDFs (searched recursively)")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: data_output/checkpoints/<job+folder hash>.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=SCREEN_CONCURRENCY, help="resumes screened at the same time")
+    parser.add_argument("--no-retry-failed", action="store_true", help="do not screen resumes that failed in an earlier run again")
+    parser.add_argument("--log", help="write the pipeline's log to this file instead of stdout")
+    parser.add_argument("--top", type=int, default=10, help="best candidates listed at the end")
+    args = parser.parse_args(argv)
+
+    with open(args.job_description) as f:
+        job_description = f.read().strip()
+    if not os.path.isdir(args.resume_dir):
+        parser.error(f"{args.resume_dir} is not a folder.")
+    checkpoint_path = args.checkpoint or default_checkpoint_path(job_description, args.resume_dir)
+    print(f"Checkpoint: {checkpoint_path} ({PDF_WORKERS} PDF workers, concurrency {args.concurrency})", file=sys.stderr)
+
+    log = open(args.log, "a") if args.log else None
+    stdout = sys.stdout
+    if log is not None:
+        sys.stdout = log
+    try:
+        summary = asyncio.run(screen_folder(
+            job_description, args.resume_dir, checkpoint_path, args.concurrency, retry_failed=not args.no_retry_failed,
+        ))
+    except KeyboardInterrupt:
+        print("\nInterrupted. Run the same command again to screen the remaining resumes.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        sys.stdout = stdout
+        if log is not None:
+            log.close()
+
+    print(json.dumps(summary, indent=2))
+    top = get_candidate_store().query(job_description_id=summary["job_description_id"], order_by="score", limit=args.top)
+    if top:
+        print(f"\nTop {len(top)} candidates:")
+        for candidate in top:
+            print(f"  {candidate['score'] if candidate['score'] is not None else '-':>4}  {candidate['name'] or candidate['filename']}  ({candidate['filename']})")
+
+
+if __name__ == "__main__":
+    main()
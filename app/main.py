@@ -1,21 +1,43 @@
 # app/main.py
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse, PlainTextResponse
+from contextlib import asynccontextmanager
 from typing import List
 import uvicorn
-import os
+import asyncio
+import itertools
 import json
-import uuid
-import re
+import time
+
+from app.services.screening import screen_resumes, iter_screen_resumes, start_job
+from app.services.archive import open_resume_archive, ArchiveError
+from app.services.jobs import submit_job, get_job, get_job_candidates
+from app.services.skills import skill_matrix
+from app.services.candidate_store import get_candidate_store
+from app.services.metrics import render_metrics
+from app.services.github_client import close_github_client
+from app.services.pdf_extractor import shutdown_pdf_pool
+from app.services.github_cache import get_github_cache
+from app.services.github_rate_limiter import get_rate_limit_scheduler
+from app.services.resume_cache import get_resume_cache
+from app.services.repo_cache import get_repo_cache
+from app.services.github_name_search import get_name_search_cache
+from app.agents.llm_cache import get_llm_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled GitHub connections and the PDF workers on shutdown
+    await close_github_client()
+    shutdown_pdf_pool()
 
-from app.services.pdf_parser import extract_text_from_pdf, find_github_url_with_llm 
-from app.services.github_scraper import get_github_data, find_github_profile_by_name
-from app.agents.resume_parser import parse_resume
-from app.agents.evaluator import evaluate_candidate
 
 app = FastAPI(
     title="SmartScan AI",
     description="An AI-powered tool to automate internship application screening.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 @app.get("/")
@@ -23,140 +45,240 @@ def read_root():
     return {"message": "SmartScan AI is up and running!"}
 
 
+async def _read_uploads(resumes: List[UploadFile] | None, archive: UploadFile | None, keep_archive: bool = False):
+    """
+    Reads the uploaded PDFs and opens the uploaded zip/tar archive, if any.
+    Returns (uploads, archive); 400 if there are no resumes or the archive cannot be used.
+    `keep_archive` copies the archive so it can still be read after the handler returns.
+    """
+    uploads = [(resume.filename, await resume.read()) for resume in resumes or []]
+    resume_archive = None
+    if archive is not None:
+        try:
+            resume_archive = await asyncio.to_thread(open_resume_archive, archive.file, archive.filename, keep_archive)
+        except ArchiveError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if not uploads and resume_archive is None:
+        raise HTTPException(status_code=400, detail="Upload PDF resumes or an archive of them.")
+    return uploads, resume_archive
+
 @app.post("/screen")
 async def screen_candidates(
     job_description: str = Form(...),
-    resumes: List[UploadFile] = File(...),
+    resumes: List[UploadFile] | None = File(None),
+    archive: UploadFile | None = File(None),
 ):
     print(f"Received Job Description: {job_description}")
-    
-    evaluation_results = []
-    
-    # Store the job description
-    job_description_id = str(uuid.uuid4())
-    os.makedirs(f"data_output/{job_description_id}", exist_ok=True)
-    with open(f"data_output/{job_description_id}/job_description.json", "w") as f:
-        json.dump({"job_description": job_description}, f, indent=4)
-    
-    for resume in resumes:
-        print(f"Processing resume: {resume.filename}")
-        candidate_id = str(uuid.uuid4())
-        
-        # 1. Extract text from PDF
-        resume_text = extract_text_from_pdf(resume)
-        
-        # Data dictionary to store all intermediate steps
-        candidate_data = {
-            "candidate_id": candidate_id,
-            "job_description": job_description,
-            "filename": resume.filename,
-            "raw_resume_text": resume_text,
-            "parsed_resume_data": {},
-            "github_data": {},
-            "final_evaluation": {}
-        }
-        
-        if not resume_text:
-            print(f"Warning: Could not extract text from {resume.filename}. Skipping this candidate.")
-            continue
-        
-        # 2. Use the agent to parse the resume text
-        parsed_resume_data = parse_resume(resume_text)
-        candidate_data["parsed_resume_data"] = parsed_resume_data
-
-        candidate_name = parsed_resume_data.get('name')
-        if not candidate_name:
-            parsed_resume_data['name'] = os.path.splitext(resume.filename)[0]
-            candidate_name = parsed_resume_data.get('name')
-            print(f"Warning: Could not extract a name. Using filename as name: {candidate_name}")
-
-        # 3. Find GitHub URL
-        github_url = find_github_url_with_llm(resume_text)
-        github_username = None
-        #github_found_by_llm = False # <-- NEW: Flag to track if LLM found the URL
-
-        if github_url:
-            github_username = github_url.split('/')[-1]
-            #github_found_by_llm = True # <-- NEW: Set flag to True
-            print(f"Found GitHub URL for {candidate_name}: {github_url}")
-        else:
-            # 4. Fallback: Search for GitHub profile by name
-            print(f"No GitHub URL found. Attempting to search for a profile for {candidate_name}.")
-            profile_url = find_github_profile_by_name(candidate_name)
-            if profile_url:
-                github_username = profile_url.split('/')[-1]
-                print(f"Fallback found profile for {candidate_name}: {profile_url}")
-
-        #----------- Old code for reference -----------
-        # # 3. Find GitHub URL        
-        # github_url = find_github_url_with_llm(resume_text)
-        # github_username = None
-        # if github_url and 'github.com' in github_url:
-        #     github_username = github_url.split('/')[-1]
-        #     print(f"Found GitHub URL for {candidate_name}: {github_url}")
-        # else:
-        #     # 4. Fallback: Search for GitHub profile by name
-        #     print(f"No GitHub URL found. Attempting to search for a profile for {candidate_name}.")
-        #     profile_url = find_github_profile_by_name(candidate_name)
-        #     if profile_url:
-        #         github_username = profile_url.split('/')[-1]
-        #         print(f"Fallback found profile for {candidate_name}: {profile_url}")
-        
-        # 5. Get GitHub data
-        github_data = {}
-        if github_username:
-            # --- REFINED FIX: Add a more specific check for invalid usernames ---
-            # GitHub usernames can only contain alphanumeric characters and hyphens.
-            if not re.match(r'^[a-zA-Z0-9-]+$', github_username):
-                print(f"Warning: Extracted username '{github_username}' is not a valid GitHub username. Skipping GitHub API call.")
-                github_username = None # Set to None to prevent API call
-            else:
-                github_data = get_github_data(github_username)
+    uploads, resume_archive = await _read_uploads(resumes, archive)
 
-        # # Add the new flag to the candidate_data dictionary
-        # candidate_data["github_found_by_llm"] = github_found_by_llm
-        candidate_data["github_data"] = github_data
+    # Store the job description
+    job_description_id = await asyncio.to_thread(start_job, job_description)
 
+    # Candidates are screened concurrently; results keep the upload order.
+    # Archive members are read one at a time as the screening makes progress.
+    source = uploads if resume_archive is None else itertools.chain(uploads, resume_archive)
+    evaluation_results = await screen_resumes(source, job_description, job_description_id)
+    archive_stats = {"archive": resume_archive.stats} if resume_archive is not None else {}
 
-         # 6. Evaluate the candidate using the evaluator agent
-        evaluation_input = {
-            "job_description": job_description,
-            "resume_data": parsed_resume_data,
-            "github_data": github_data
-        }
-
-        # --- NEW: Print the JSON input for debugging ---
-        # print("\n" + "="*50)
-        # print("JSON INPUT FOR EVALUATOR AGENT:")
-        # print(json.dumps(evaluation_input, indent=4))
-        # print("="*50 + "\n")
-        # --------------------------------------------------
-
-        evaluation = evaluate_candidate(
-            job_description=job_description,
-            resume_data=parsed_resume_data,
-            github_data=github_data
-        )
-        
-        candidate_data["final_evaluation"] = evaluation
-        #evaluation_results.append(evaluation)
-        evaluation_results.append(candidate_data)
-
-        # 7. Store all data for this candidate in a JSON file
-        with open(f"data_output/{job_description_id}/{candidate_id}.json", "w") as f:
-            json.dump(candidate_data, f, indent=4)
-    
     if not evaluation_results:
         return {
             "status": "screening_failed",
-            "message": "No candidates were successfully screened. Check the server logs for details."
+            "message": "No candidates were successfully screened. Check the server logs for details.",
+            **archive_stats,
         }
 
     return {
         "status": "screening_complete",
         "results": evaluation_results,
+        **archive_stats,
     }
 
+@app.post("/screen/stream")
+async def screen_candidates_stream(
+    job_description: str = Form(...),
+    resumes: List[UploadFile] | None = File(None),
+    archive: UploadFile | None = File(None),
+    format: str = "ndjson",
+):
+    """
+    Streaming variant of /screen. Emits a `started` event, one `candidate` (or `failed`) event
+    per resume as soon as it is finished, and a final `summary` event.
+    `format` is "ndjson" (one JSON object per line) or "sse" (Server-Sent Events).
+    With an archive, `total` is null until the summary, as the archive is read while screening.
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'.")
+
+    print(f"Received Job Description: {job_description}")
+    # Read the uploads now; they are closed once this handler returns.
+    uploads, resume_archive = await _read_uploads(resumes, archive, keep_archive=True)
+    job_description_id = await asyncio.to_thread(start_job, job_description)
+    filenames = [filename for filename, _ in uploads]
+
+    def archive_resumes():
+        for filename, pdf_bytes in resume_archive:
+            filenames.append(filename)
+            yield filename, pdf_bytes
+    source = uploads if resume_archive is None else itertools.chain(uploads, archive_resumes())
+
+    def encode(event: str, payload: dict) -> str:
+        if format == "sse":
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps({"event": event, **payload}) + "\n"
+
+    async def events():
+        started = time.perf_counter()
+        total = len(uploads) if resume_archive is None else None
+        completed = screened = 0
+        yield encode("started", {"job_description_id": job_description_id, "total": total})
+
+        async for index, candidate_data in iter_screen_resumes(source, job_description, job_description_id):
+            completed += 1
+            progress = {"index": index, "filename": filenames[index], "completed": completed, "total": total}
+            if candidate_data:
+                screened += 1
+                yield encode("candidate", {**progress, "data": candidate_data})
+            else:
+                yield encode("failed", progress)
+
+        yield encode("summary", {
+            "job_description_id": job_description_id,
+            "status": "screening_complete" if screened else "screening_failed",
+            "total": completed,
+            "screened": screened,
+            "failed": completed - screened,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            **({"archive": resume_archive.stats} if resume_archive is not None else {}),
+        })
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type)
+
+@app.post("/jobs", status_code=202)
+async def create_screening_job(
+    job_description: str = Form(...),
+    resumes: List[UploadFile] | None = File(None),
+    archive: UploadFile | None = File(None),
+):
+    """
+    Starts screening in the background and returns right away.
+    Poll GET /jobs/{job_description_id} for progress and results.
+    With an archive, `total` is null until the whole archive has been read.
+    """
+    print(f"Received Job Description: {job_description}")
+    uploads, resume_archive = await _read_uploads(resumes, archive, keep_archive=True)
+    job = await submit_job(job_description, uploads, resume_archive)
+    return {
+        "job_description_id": job["job_description_id"],
+        "status": job["status"],
+        "total": job["total"],
+    }
+
+@app.get("/jobs/{job_id}")
+def get_screening_job(job_id: str, include_results: bool = True):
+    """Returns the status, per-candidate progress and finished results of a screening job."""
+    job = get_job(job_id, include_results=include_results)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+@app.get("/jobs/{job_id}/skill-matrix")
+def get_skill_matrix(job_id: str, skills: str | None = None, require: str | None = None, min_coverage: float = 0.0):
+    """
+    Candidates x required-skills coverage of a job, computed from the stored candidates without LLM calls.
+    `skills` (comma-separated) overrides the skills found in the job description; `require` keeps only
+    candidates with all of the given skills and `min_coverage` only those covering at least that share.
+    """
+    loaded = get_job_candidates(job_id)
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    job_description, candidates = loaded
+    return skill_matrix(
+        job_description, candidates,
+        skills=_split_list(skills), require=_split_list(require), min_coverage=min_coverage,
+    )
+
+def _split_list(value: str | None) -> list[str] | None:
+    return [part.strip() for part in value.split(",") if part.strip()] if value else None
+
+@app.get("/candidates")
+def search_candidates(
+    job_id: str | None = None,
+    since_days: float | None = None,
+    min_score: float | None = None,
+    github_username: str | None = None,
+    name: str | None = None,
+    order_by: str = "score",
+    limit: int = 50,
+    offset: int = 0,
+):
+    """
+    Searches stored candidates across all jobs, e.g. the top scores of the last 30 days
+    with `?since_days=30`. Returns the indexed fields; full records are at GET /candidates/{candidate_id}.
+    """
+    since = time.time() - since_days * 86400 if since_days is not None else None
+    return get_candidate_store().query(
+        job_description_id=job_id, since=since, min_score=min_score, github_username=github_username,
+        name=name, order_by=order_by, limit=min(max(limit, 1), 500), offset=max(offset, 0),
+    )
+
+@app.get("/candidates/{candidate_id}")
+def get_candidate(candidate_id: str):
+    candidate = get_candidate_store().get_candidate(candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found.")
+    return candidate
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Stage latencies, LLM calls / tokens / cost and GitHub requests in the Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/github/cache")
+def github_cache_stats():
+    """Reports hit / miss / revalidation counts of the GitHub HTTP cache."""
+    cache = get_github_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
+@app.get("/github/repos/cache")
+def repo_cache_stats():
+    """Reports hits and misses of the per-repository data cache (keyed by owner/repo and pushed_at)."""
+    cache = get_repo_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
+@app.get("/github/name-search/cache")
+def name_search_cache_stats():
+    """Reports hits (including cached names without a match) of the name -> profile search cache."""
+    cache = get_name_search_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
+@app.get("/resumes/cache")
+def resume_cache_stats():
+    """Reports usage of the resume artifact cache (keyed by PDF hash)."""
+    cache = get_resume_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
+@app.get("/github/quota")
+def github_quota():
+    """Reports the remaining GitHub API quota of every configured token."""
+    return {"tokens": get_rate_limit_scheduler().snapshot()}
+
+@app.get("/llm/cache")
+def llm_cache_stats():
+    """Reports hit rates of the shared LLM response cache."""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
 
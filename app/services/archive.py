@@ -0,0 +1,190 @@
+# app/services/archive.py
+# Bulk upload: the PDF resumes of one zip or tar archive, read one member at a time, so a
+# large archive never has to be held in memory.
+import hashlib
+import lzma
+import os
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import zipfile
+import zlib
+
+# Errors of reading one zip member (bad CRC, encrypted, unsupported compression, corrupt data);
+# the other members are still read.
+_ZIP_MEMBER_ERRORS = (zipfile.BadZipFile, RuntimeError, NotImplementedError, zlib.error, lzma.LZMAError, EOFError, OSError)
+
+# Per-archive limits: entries, total uncompressed size and size of a single resume.
+ARCHIVE_MAX_MEMBERS = int(os.getenv("ARCHIVE_MAX_MEMBERS", "5000"))
+ARCHIVE_MAX_TOTAL_MB = float(os.getenv("ARCHIVE_MAX_TOTAL_MB", "2048"))
+ARCHIVE_MAX_FILE_MB = float(os.getenv("ARCHIVE_MAX_FILE_MB", "10"))
+
+
+class ArchiveError(ValueError):
+    """The upload is not a readable zip/tar archive, or it exceeds the archive limits."""
+
+
+def _is_resume_name(name: str) -> bool:
+    basename = posixpath.basename(name)
+    # macOS adds resource forks (__MACOSX/, ._file.pdf) to zips made in the Finder
+    return name.lower().endswith(".pdf") and not basename.startswith("._") and "__MACOSX/" not in name
+
+
+class ResumeArchive:
+    """
+    Iterates the PDF resumes of a zip or tar (optionally gzip/bz2/xz compressed) archive as
+    (member path, PDF bytes), reading and decompressing one member at a time.
+    Entries that are not PDFs, larger than ARCHIVE_MAX_FILE_MB, duplicates of an earlier
+    resume (same SHA-256) or unreadable zip members are skipped. Zip archives over the member or size limits are rejected
+    up front from their central directory; a tar stream is cut off once it reaches a limit.
+    `stats` counts what was read and skipped.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        name: str = "",
+        max_members: int = ARCHIVE_MAX_MEMBERS,
+        max_total_bytes: int = int(ARCHIVE_MAX_TOTAL_MB * 1024 * 1024),
+        max_file_bytes: int = int(ARCHIVE_MAX_FILE_MB * 1024 * 1024),
+    ):
+        self.name = name
+        self.max_members = max_members
+        self.max_total_bytes = max_total_bytes
+        self.max_file_bytes = max_file_bytes
+        self.stats = {
+            "members": 0,
+            "resumes": 0,
+            "not_pdf": 0,
+            "too_large": 0,
+            "duplicates": 0,
+            "unreadable": 0,
+            "uncompressed_bytes": 0,
+            "truncated": False,
+        }
+        self._fileobj = fileobj
+        self._seen = set()
+
+        fileobj.seek(0)
+        if zipfile.is_zipfile(fileobj):
+            fileobj.seek(0)
+            try:
+                self._zip = zipfile.ZipFile(fileobj)
+            except zipfile.BadZipFile as e:
+                raise ArchiveError(f"{name or 'archive'} is not a valid zip file: {e}") from e
+            self._check_zip_limits()
+        else:
+            fileobj.seek(0)
+            self._zip = None
+            try:
+                # Stream mode ("r|*"): members are read in order, without seeking back
+                self._tar = tarfile.open(fileobj=fileobj, mode="r|*")
+            except tarfile.TarError as e:
+                raise ArchiveError(f"{name or 'The archive'} is neither a zip nor a tar archive.") from e
+
+    def _check_zip_limits(self):
+        files = [info for info in self._zip.infolist() if not info.is_dir()]
+        if len(files) > self.max_members:
+            raise ArchiveError(f"The archive has {len(files)} entries; at most {self.max_members} are allowed.")
+        total = sum(info.file_size for info in files)
+        if total > self.max_total_bytes:
+            raise ArchiveError(
+                f"The archive unpacks to {total / 1024 / 1024:.0f} MB; "
+                f"at most {self.max_total_bytes / 1024 / 1024:.0f} MB are allowed."
+            )
+
+    def __iter__(self):
+        try:
+            members = self._zip_members() if self._zip is not None else self._tar_members()
+            for member_name, size, read in members:
+                self.stats["members"] += 1
+                if self.stats["members"] > self.max_members or self.stats["uncompressed_bytes"] + size > self.max_total_bytes:
+                    print(f"Warning: {self.name or 'archive'} exceeds the archive limits. Ignoring the remaining entries.")
+                    self.stats["members"] -= 1
+                    self.stats["truncated"] = True
+                    break
+                if not _is_resume_name(member_name):
+                    self.stats["not_pdf"] += 1
+                    continue
+                if size > self.max_file_bytes:
+                    print(f"Warning: Skipping {member_name} ({size / 1024 / 1024:.1f} MB exceeds ARCHIVE_MAX_FILE_MB).")
+                    self.stats["too_large"] += 1
+                    continue
+
+                # Read one byte more than allowed, in case the declared size is wrong
+                try:
+                    pdf_bytes = read(self.max_file_bytes + 1)
+                except _ZIP_MEMBER_ERRORS as e:
+                    if self._zip is None:
+                        # In a tar stream the following members cannot be reached either
+                        raise
+                    print(f"Warning: Skipping unreadable {member_name}: {e}")
+                    self.stats["unreadable"] += 1
+                    continue
+                self.stats["uncompressed_bytes"] += len(pdf_bytes)
+                if len(pdf_bytes) > self.max_file_bytes:
+                    self.stats["too_large"] += 1
+                    continue
+                if b"%PDF-" not in pdf_bytes[:1024]:
+                    self.stats["not_pdf"] += 1
+                    continue
+                digest = hashlib.sha256(pdf_bytes).digest()
+                if digest in self._seen:
+                    self.stats["duplicates"] += 1
+                    continue
+                self._seen.add(digest)
+                self.stats["resumes"] += 1
+                yield member_name, pdf_bytes
+        except (zipfile.BadZipFile, tarfile.TarError, zlib.error, lzma.LZMAError, EOFError, OSError) as e:
+            # The entries read so far are still screened
+            print(f"Warning: Could not read the rest of {self.name or 'the archive'}: {e}")
+            self.stats["truncated"] = True
+        finally:
+            print(f"Archive {self.name or ''}: {self.stats}")
+            self.close()
+
+    def _zip_members(self):
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+
+            def read(limit: int, info=info) -> bytes:
+                with self._zip.open(info) as member:
+                    return member.read(limit)
+            yield info.filename, info.file_size, read
+
+    def _tar_members(self):
+        for member in self._tar:
+            if not member.isfile():
+                continue
+
+            def read(limit: int, member=member) -> bytes:
+                return self._tar.extractfile(member).read(limit)
+            yield member.name, member.size, read
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+        self._fileobj.close()
+
+
+def open_resume_archive(fileobj, name: str = "", copy: bool = False) -> ResumeArchive:
+    """
+    Opens an uploaded archive. With `copy=True` the upload is first copied, in chunks, to an
+    anonymous temporary file owned by the archive, for reading after the request has finished
+    (FastAPI closes uploaded files when the endpoint returns).
+    """
+    if copy:
+        spooled = tempfile.TemporaryFile()
+        fileobj.seek(0)
+        shutil.copyfileobj(fileobj, spooled, 1024 * 1024)
+        fileobj = spooled
+    try:
+        return ResumeArchive(fileobj, name)
+    except ArchiveError:
+        if copy:
+            fileobj.close()
+        raise
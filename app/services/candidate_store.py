@@ -0,0 +1,283 @@
+# app/services/candidate_store.py
+# Screening results in one SQLite file: the fields that are queried live in indexed columns,
+# the full candidate record is kept next to them as zlib-compressed JSON.
+#
+#   python -m app.services.candidate_store migrate [data_output]     import per-candidate JSON files
+#   python -m app.services.candidate_store export out.parquet [--job ID]
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+CANDIDATE_STORE_PATH = os.getenv("CANDIDATE_STORE_PATH", "data_output/candidates.sqlite")
+
+# Columns returned by queries (everything but the record itself).
+_COLUMNS = ("candidate_id", "job_description_id", "name", "filename", "score", "github_username", "created_at", "updated_at")
+_ORDERS = {
+    "score": "score DESC, created_at DESC",
+    "created_at": "created_at DESC",
+    "name": "name COLLATE NOCASE",
+}
+
+
+def _pack(record: dict) -> bytes:
+    return zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob))
+
+
+def _score(candidate_data: dict) -> float | None:
+    score = (candidate_data.get("final_evaluation") or {}).get("score")
+    return float(score) if isinstance(score, (int, float)) else None
+
+
+class CandidateStore:
+    """
+    SQLite store for screening jobs and candidate records.
+    Job, candidate, name, score, GitHub username and timestamps are indexed columns;
+    the full record (resume text, GitHub data, evaluation) is stored compressed.
+    Safe to share between threads and processes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_description_id TEXT PRIMARY KEY,"
+            " job_description TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " candidate_id TEXT PRIMARY KEY,"
+            " job_description_id TEXT NOT NULL,"
+            " name TEXT,"
+            " filename TEXT,"
+            " score REAL,"
+            " github_username TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " record BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS candidates_job ON candidates (job_description_id, score DESC)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS candidates_score ON candidates (score DESC, created_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS candidates_created ON candidates (created_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS candidates_github ON candidates (github_username)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS candidates_name ON candidates (name COLLATE NOCASE)")
+        self._conn.commit()
+
+    def save_job(self, job_description_id: str, job_description: str, created_at: float | None = None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_description_id, job_description, created_at) VALUES (?, ?, ?)",
+                (job_description_id, job_description, created_at or time.time()),
+            )
+            self._conn.commit()
+
+    def get_job_description(self, job_description_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_description FROM jobs WHERE job_description_id = ?", (job_description_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_candidate(self, candidate_data: dict, job_description_id: str, created_at: float | None = None):
+        """Inserts or replaces a candidate record."""
+        now = time.time()
+        parsed = candidate_data.get("parsed_resume_data") or {}
+        name = (candidate_data.get("final_evaluation") or {}).get("candidate_name") or parsed.get("name")
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO candidates"
+                " (candidate_id, job_description_id, name, filename, score, github_username, created_at, updated_at, record)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (candidate_id) DO UPDATE SET"
+                " job_description_id = excluded.job_description_id, name = excluded.name, filename = excluded.filename,"
+                " score = excluded.score, github_username = excluded.github_username,"
+                " updated_at = excluded.updated_at, record = excluded.record",
+                (
+                    candidate_data["candidate_id"],
+                    job_description_id,
+                    name,
+                    candidate_data.get("filename"),
+                    _score(candidate_data),
+                    candidate_data.get("github_username"),
+                    created_at or now,
+                    now,
+                    sqlite3.Binary(_pack(candidate_data)),
+                ),
+            )
+            self._conn.commit()
+
+    def get_candidate(self, candidate_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM candidates WHERE candidate_id = ?", (candidate_id,)).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def list_candidates(self, job_description_id: str) -> list[dict]:
+        """The full records of all candidates of a job, best score first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record FROM candidates WHERE job_description_id = ? ORDER BY score DESC, created_at",
+                (job_description_id,),
+            ).fetchall()
+        return [_unpack(row[0]) for row in rows]
+
+    def query(
+        self,
+        job_description_id: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        min_score: float | None = None,
+        github_username: str | None = None,
+        name: str | None = None,
+        order_by: str = "score",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict]:
+        """
+        Searches candidates across jobs using the indexed columns only (no records are decompressed),
+        e.g. the top scores of the last 30 days: query(since=time.time() - 30 * 86400).
+        `name` matches case-insensitively on a prefix.
+        """
+        conditions, params = [], []
+        if job_description_id:
+            conditions.append("job_description_id = ?")
+            params.append(job_description_id)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+        if min_score is not None:
+            conditions.append("score >= ?")
+            params.append(min_score)
+        if github_username:
+            conditions.append("github_username = ?")
+            params.append(github_username)
+        if name:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM candidates"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {_ORDERS.get(order_by, _ORDERS['score'])} LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def export_parquet(self, path: str, job_description_id: str | None = None) -> int:
+        """
+        Writes the candidates (indexed columns plus the record as a JSON string) to a Parquet file.
+        Returns the number of rows written. Needs pyarrow.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        sql = f"SELECT {', '.join(_COLUMNS)}, record FROM candidates"
+        params = ()
+        if job_description_id:
+            sql += " WHERE job_description_id = ?"
+            params = (job_description_id,)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        columns = {column: [row[position] for row in rows] for position, column in enumerate(_COLUMNS)}
+        columns["record"] = [zlib.decompress(row[-1]).decode("utf-8") for row in rows]
+        pq.write_table(pa.table(columns), path, compression="zstd")
+        return len(rows)
+
+    def info(self) -> dict:
+        with self._lock:
+            jobs = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            candidates, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(record)), 0) FROM candidates"
+            ).fetchone()
+        return {"path": self.path, "jobs": jobs, "candidates": candidates, "record_bytes": stored_bytes}
+
+
+_store: CandidateStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_candidate_store() -> CandidateStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CandidateStore(CANDIDATE_STORE_PATH)
+    return _store
+
+
+def migrate_data_output(root: str, store: CandidateStore) -> dict:
+    """
+    Imports data_output/{job_id}/job_description.json and {candidate_id}.json files into the store.
+    The files are left in place; importing the same tree twice does not create duplicates.
+    """
+    counts = {"jobs": 0, "candidates": 0, "skipped": 0}
+    for job_dir in sorted(glob.glob(os.path.join(root, "*"))):
+        if not os.path.isdir(job_dir):
+            continue
+        job_id = os.path.basename(job_dir)
+        description_path = os.path.join(job_dir, "job_description.json")
+        if os.path.exists(description_path):
+            with open(description_path) as f:
+                store.save_job(job_id, json.load(f).get("job_description", ""), created_at=os.path.getmtime(description_path))
+            counts["jobs"] += 1
+
+        for path in sorted(glob.glob(os.path.join(job_dir, "*.json"))):
+            if os.path.basename(path) in ("job_description.json", "job_status.json"):
+                continue
+            try:
+                with open(path) as f:
+                    record = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping {path}: {e}")
+                counts["skipped"] += 1
+                continue
+            if not isinstance(record, dict) or not record.get("candidate_id"):
+                print(f"Skipping {path}: not a candidate record.")
+                counts["skipped"] += 1
+                continue
+            store.save_candidate(record, job_id, created_at=os.path.getmtime(path))
+            counts["candidates"] += 1
+    return counts
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m app.services.candidate_store")
+    parser.add_argument("--store", default=CANDIDATE_STORE_PATH, help="SQLite file of the candidate store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser("migrate", help="import an existing data_output tree")
+    migrate.add_argument("root", nargs="?", default="data_output")
+    export = commands.add_parser("export", help="export candidates to Parquet")
+    export.add_argument("path")
+    export.add_argument("--job", help="only this job_description_id")
+    args = parser.parse_args(argv)
+
+    store = CandidateStore(args.store)
+    if args.command == "migrate":
+        counts = migrate_data_output(args.root, store)
+        print(f"Imported {counts['jobs']} jobs and {counts['candidates']} candidates ({counts['skipped']} files skipped) into {args.store}.")
+    else:
+        rows = store.export_parquet(args.path, args.job)
+        print(f"Wrote {rows} candidates to {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# app/services/github_cache.py
+import os
+import json
+import time
+
+import httpx
+
+from app.services.sqlite_cache import CACHE_DIR, SQLiteCache
+
+GITHUB_CACHE_ENABLED = os.getenv("GITHUB_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+GITHUB_CACHE_PATH = os.getenv("GITHUB_CACHE_PATH", os.path.join(CACHE_DIR, "github_http.sqlite"))
+GITHUB_CACHE_MAX_MB = int(os.getenv("GITHUB_CACHE_MAX_MB", "512"))
+# Responses younger than this are served without contacting GitHub at all
+# (GitHub itself sends `Cache-Control: max-age=60`). Older ones are revalidated.
+GITHUB_CACHE_MAX_AGE = int(os.getenv("GITHUB_CACHE_MAX_AGE", "60"))
+
+# Only the headers needed to rebuild a usable response are kept.
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+class GitHubHTTPCache:
+    """
+    Conditional-request cache for GitHub API GET responses.
+    Each body is stored with its ETag / Last-Modified validators; stale entries are
+    revalidated with If-None-Match / If-Modified-Since, and GitHub's 304 answers do not
+    count against the rate limit.
+    """
+
+    def __init__(self, store: SQLiteCache, max_age: int = GITHUB_CACHE_MAX_AGE):
+        self.store = store
+        self.max_age = max_age
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+    def lookup(self, url: str) -> dict | None:
+        """Returns the cached entry for a URL, or None."""
+        value = self.store.get(url)
+        if value is None:
+            return None
+        meta, _, body = value.partition(b"\n")
+        entry = json.loads(meta)
+        entry["body"] = body
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["stored_at"] < self.max_age
+
+    def conditional_headers(self, entry: dict) -> dict:
+        headers = {}
+        if entry["headers"].get("etag"):
+            headers["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        return headers
+
+    def store_response(self, url: str, response: httpx.Response):
+        """Stores a successful response if GitHub sent validators for it."""
+        if response.status_code != 200:
+            return
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+        meta = json.dumps({"stored_at": time.time(), "headers": headers}, separators=(",", ":"))
+        self.store.set(url, meta.encode("utf-8") + b"\n" + response.content)
+        self.stats["stored"] += 1
+
+    def refresh(self, url: str, entry: dict):
+        """Marks a revalidated entry as fresh again."""
+        meta = json.dumps({"stored_at": time.time(), "headers": entry["headers"]}, separators=(",", ":"))
+        self.store.set(url, meta.encode("utf-8") + b"\n" + entry["body"])
+
+    def build_response(self, entry: dict, request: httpx.Request, extra_headers: httpx.Headers | None = None) -> httpx.Response:
+        """Rebuilds a 200 response from a cache entry (keeping rate-limit headers of a 304, if any)."""
+        headers = httpx.Headers(entry["headers"])
+        if extra_headers is not None:
+            for name, value in extra_headers.items():
+                if name.lower().startswith("x-ratelimit"):
+                    headers[name] = value
+        return httpx.Response(200, headers=headers, content=entry["body"], request=request)
+
+    def info(self) -> dict:
+        requests_seen = self.stats["hits"] + self.stats["revalidated"] + self.stats["misses"]
+        hit_rate = (self.stats["hits"] + self.stats["revalidated"]) / requests_seen if requests_seen else 0.0
+        return {**self.stats, "hit_rate": round(hit_rate, 4), "store": self.store.info()}
+
+
+_cache: GitHubHTTPCache | None = None
+
+
+def get_github_cache() -> GitHubHTTPCache | None:
+    """Returns the process-wide GitHub HTTP cache, or None when caching is disabled."""
+    global _cache
+    if not GITHUB_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = GitHubHTTPCache(SQLiteCache(GITHUB_CACHE_PATH, GITHUB_CACHE_MAX_MB * 1024 * 1024))
+    return _cache
@@ -0,0 +1,160 @@
+# app/services/github_client.py
+import asyncio
+import email.utils
+import os
+import time
+import weakref
+
+import httpx
+
+from app.services.github_cache import GitHubHTTPCache, get_github_cache
+from app.services.github_rate_limiter import RateLimitScheduler, get_rate_limit_scheduler
+from app.services.metrics import record_github_request
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+# Cap on concurrent requests (and pooled keep-alive connections) to the GitHub API.
+GITHUB_MAX_CONNECTIONS = int(os.getenv("GITHUB_MAX_CONNECTIONS", "16"))
+GITHUB_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", "20"))
+# How often a request that hit a rate limit is retried (with another token, or after the reset).
+GITHUB_RATE_LIMIT_RETRIES = int(os.getenv("GITHUB_RATE_LIMIT_RETRIES", "3"))
+# Seconds a token is parked after a secondary rate limit whose Retry-After cannot be read.
+GITHUB_RETRY_AFTER_DEFAULT = float(os.getenv("GITHUB_RETRY_AFTER_DEFAULT", "60"))
+
+
+class GitHubClient:
+    """
+    Async client for the GitHub API backed by one shared keep-alive connection pool.
+    At most `max_connections` requests are in flight at once; the rest wait their turn.
+    Every request is authenticated with a token handed out by the rate-limit scheduler.
+    """
+
+    def __init__(
+        self,
+        base_url: str = GITHUB_API_URL,
+        max_connections: int = GITHUB_MAX_CONNECTIONS,
+        timeout: float = GITHUB_TIMEOUT,
+        cache: GitHubHTTPCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+    ):
+        self.base_url = base_url
+        self.cache = cache
+        self.scheduler = scheduler or get_rate_limit_scheduler()
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"Accept": "application/vnd.github+json"},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            # Requests queue on the semaphore, so waiting for a pooled connection is never a timeout.
+            timeout=httpx.Timeout(timeout, pool=None),
+        )
+
+    async def get(self, path: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+        """
+        Sends a GET request for a path relative to the API base URL.
+        With a cache attached, fresh responses are served locally and stale ones are revalidated.
+        The cache file is read and written in worker threads, off the event loop.
+        """
+        request = self._client.build_request("GET", path, params=params, headers=headers)
+        if self.cache is None:
+            return await self._send(request)
+
+        url = str(request.url)
+        entry = await asyncio.to_thread(self.cache.lookup, url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.stats["hits"] += 1
+            record_github_request(_rate_limit_resource(request), "cached")
+            return self.cache.build_response(entry, request)
+        if entry is not None:
+            request.headers.update(self.cache.conditional_headers(entry))
+
+        response = await self._send(request)
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats["revalidated"] += 1
+            await asyncio.to_thread(self.cache.refresh, url, entry)
+            return self.cache.build_response(entry, request, response.headers)
+
+        self.cache.stats["misses"] += 1
+        await asyncio.to_thread(self.cache.store_response, url, response)
+        return response
+
+    async def post(self, path: str, json: dict, headers: dict | None = None) -> httpx.Response:
+        """Sends a POST request (used for GraphQL queries, which are never cached)."""
+        request = self._client.build_request("POST", path, json=json, headers=headers)
+        return await self._send(request)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        resource = _rate_limit_resource(request)
+        for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+            token = await self.scheduler.acquire(resource)
+            if token:
+                request.headers["Authorization"] = f"token {token}"
+            else:
+                request.headers.pop("Authorization", None)
+
+            response = None
+            try:
+                async with self._semaphore:
+                    response = await self._client.send(request)
+            finally:
+                self.scheduler.release(token, resource, response.headers if response is not None else None)
+                record_github_request(resource, str(response.status_code) if response is not None else "error")
+
+            if response.status_code in (403, 429) and attempt < GITHUB_RATE_LIMIT_RETRIES:
+                retry_after = response.headers.get("Retry-After")
+                if retry_after is not None:
+                    # Secondary rate limit: park this token and retry.
+                    self.scheduler.exhaust(token, resource, _retry_after_seconds(retry_after))
+                    continue
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    # The scheduler now knows this token is exhausted and picks another one (or waits).
+                    continue
+            return response
+        return response
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+def _retry_after_seconds(value: str) -> float:
+    """The wait of a Retry-After header, given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        print(f"Warning: Unreadable Retry-After header '{value}'; waiting {GITHUB_RETRY_AFTER_DEFAULT:.0f} s.")
+        return GITHUB_RETRY_AFTER_DEFAULT
+
+
+def _rate_limit_resource(request: httpx.Request) -> str:
+    """Name of the GitHub rate-limit bucket a request is counted against."""
+    path = request.url.path
+    if path.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in path:
+        return "search"
+    return "core"
+
+
+# httpx connection pools are bound to the event loop they were created on,
+# so there is one shared client per running loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GitHubClient]" = weakref.WeakKeyDictionary()
+
+
+def get_github_client() -> GitHubClient:
+    """Returns the shared GitHub client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = GitHubClient(cache=get_github_cache())
+        _clients[loop] = client
+    return client
+
+
+async def close_github_client():
+    """Closes the shared client of the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,145 @@
+# app/services/github_graphql.py
+import os
+
+import httpx
+
+from app.services.github_client import GITHUB_API_URL, get_github_client
+from app.services.repo_ranking import rank_repos
+from app.agents.context_builder import excerpt_readme
+
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", f"{GITHUB_API_URL}/graphql")
+# Repositories fetched per GraphQL page, and the total cap per candidate.
+GITHUB_GRAPHQL_PAGE_SIZE = int(os.getenv("GITHUB_GRAPHQL_PAGE_SIZE", "25"))
+GITHUB_GRAPHQL_MAX_REPOS = int(os.getenv("GITHUB_GRAPHQL_MAX_REPOS", "100"))
+
+# One query returns the profile, a page of repositories and, nested inside every
+# repository, its README blob and last 3 commits on the default branch.
+PROFILE_QUERY = """
+query($login: String!, $pageSize: Int!, $cursor: String) {
+  user(login: $login) {
+    login
+    followers { totalCount }
+    repositories(first: $pageSize, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: PUSHED_AT, direction: DESC}) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        stargazerCount
+        isFork
+        isArchived
+        pushedAt
+        repositoryTopics(first: 10) { nodes { topic { name } } }
+        primaryLanguage { name }
+        readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+        readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: 3) { nodes { oid message } }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class GraphQLError(Exception):
+    pass
+
+
+async def get_github_data_graphql(username: str, job_description: str | None = None, max_projects: int | None = None) -> dict:
+    """
+    Fetches the same data as the REST backend of get_github_data, but with one
+    GraphQL query per page of repositories instead of two REST calls per repo.
+    Like the REST backend, the repositories are ordered by relevance to the job
+    (stars and recency without one) and cut to `max_projects`.
+    The repo cache of the REST backend is not used: READMEs and commits arrive inside the
+    listing query, so a cache hit would not save a request.
+    """
+    client = get_github_client()
+    nodes = []
+    user = None
+    cursor = None
+
+    try:
+        while True:
+            variables = {"login": username, "pageSize": GITHUB_GRAPHQL_PAGE_SIZE, "cursor": cursor}
+            user = await _query_user(client, variables)
+            repositories = user["repositories"]
+            nodes.extend(node for node in repositories["nodes"] if node)
+
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"] or len(nodes) >= GITHUB_GRAPHQL_MAX_REPOS:
+                break
+            cursor = page_info["endCursor"]
+    except httpx.HTTPError as e:
+        return {"error": f"API request failed: {e}"}
+    except GraphQLError as e:
+        return {"error": f"GraphQL query failed: {e}"}
+
+    # Topics and the archived flag count in the ranking but are not part of a project entry.
+    ranked = rank_repos(
+        [
+            {**_to_project(node), "topics": _topics(node), "archived": node.get("isArchived", False)}
+            for node in nodes[:GITHUB_GRAPHQL_MAX_REPOS]
+        ],
+        job_description or "",
+    )
+    projects = [
+        {key: value for key, value in repo.items() if key not in ("topics", "archived")}
+        for repo in ranked[:max_projects]
+    ]
+    for project in projects:
+        project["readme_excerpt"] = excerpt_readme(project["readme_content"])
+
+    return {
+        "username": user.get("login"),
+        "public_repos": user["repositories"]["totalCount"],
+        "projects": projects,
+        "followers": user["followers"]["totalCount"]
+    }
+
+
+async def _query_user(client, variables: dict) -> dict:
+    response = await client.post(GITHUB_GRAPHQL_URL, json={"query": PROFILE_QUERY, "variables": variables})
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("errors"):
+        raise GraphQLError("; ".join(error.get("message", "unknown error") for error in payload["errors"]))
+    user = (payload.get("data") or {}).get("user")
+    if user is None:
+        raise GraphQLError(f"User '{variables['login']}' not found.")
+    return user
+
+
+def _topics(node: dict) -> list[str]:
+    return [
+        ((entry or {}).get("topic") or {}).get("name")
+        for entry in (node.get("repositoryTopics") or {}).get("nodes") or []
+        if ((entry or {}).get("topic") or {}).get("name")
+    ]
+
+
+def _to_project(node: dict) -> dict:
+    """Maps a GraphQL repository node onto the project format of the REST backend."""
+    readme = node.get("readme") or node.get("readmeLower") or {}
+    history = ((node.get("defaultBranchRef") or {}).get("target") or {}).get("history") or {}
+    return {
+        "name": node.get("name"),
+        "description": node.get("description"),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "stars": node.get("stargazerCount"),
+        "fork": node.get("isFork", False),
+        "pushed_at": node.get("pushedAt"),
+        "readme_content": readme.get("text"),
+        "readme_excerpt": None,
+        "recent_commits": [
+            {"message": commit.get("message"), "sha": commit.get("oid", "")[:7]}
+            for commit in history.get("nodes", [])
+        ]
+    }
@@ -0,0 +1,97 @@
+# app/services/github_handle.py
+import re
+from collections import Counter
+
+# Bump when the extraction rules change, so cached resume artifacts are recomputed.
+EXTRACTOR_VERSION = "3"
+
+GITHUB_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$')
+
+# github.com/<user>[/<repo>] with optional scheme / www, and tolerant of the spaces and line
+# breaks that PDF text extraction tends to insert around '.' and '/'.
+_URL_PATTERN = re.compile(
+    r'(?:https?\s*:\s*/\s*/\s*)?(?:www\s*\.\s*)?github\s*\.\s*com\s*/\s*([A-Za-z0-9][A-Za-z0-9-]{0,38})'
+    r'(?:\s*/[ \t]*([A-Za-z0-9_.-]+))?',
+    re.IGNORECASE,
+)
+# <user>.github.io (GitHub Pages)
+_PAGES_PATTERN = re.compile(r'\b([A-Za-z0-9][A-Za-z0-9-]{0,38})\s*\.\s*github\s*\.\s*io\b', re.IGNORECASE)
+# "GitHub: user" / "GitHub - @user" on a line of its own (after an optional bullet), so that
+# "Tools: Docker, GitHub | Jira" or "GitHub - Built CI pipelines" do not yield a handle.
+_LABEL_PATTERN = re.compile(
+    r'^[ \t•·*▪-]*github[ \t]*(?::|-|–|\|)[ \t]*@?([A-Za-z0-9][A-Za-z0-9-]{0,38})[ \t]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# First path segments on github.com that are site pages, not user profiles.
+_RESERVED_PATHS = {
+    "about", "apps", "blog", "collections", "contact", "customer-stories", "enterprise", "events",
+    "explore", "features", "git-guides", "in", "issues", "join", "login", "marketplace", "new",
+    "notifications", "orgs", "organizations", "pricing", "pulls", "readme", "search", "security",
+    "settings", "site", "sponsors", "team", "topics", "trending", "users",
+}
+
+# Ordered from most to least trustworthy. "pdf_repo_link" / "text_repo_url" are links to
+# repositories only (github.com/<owner>/<repo>), whose owner may be a library or an employer.
+_SOURCES = ("pdf_link", "text_url", "github_pages", "text_label", "pdf_repo_link", "text_repo_url")
+# Sources trusted without asking the LLM: profile links, GitHub Pages, and the owner most repo links
+# agree on. A single repo link or a label ("GitHub: Collaboration") has to be confirmed.
+TRUSTED_SOURCES = ("pdf_link", "text_url", "github_pages")
+# Links of a source trusted by the owner of their repos: where a profile link is missing, at least
+# this many repo links, and more than half of them, must share the owner.
+_REPO_OWNER_MIN_LINKS = 2
+
+
+def _valid(username: str) -> bool:
+    return bool(GITHUB_USERNAME_PATTERN.match(username)) and username.lower() not in _RESERVED_PATHS
+
+
+def _add_url(candidates: dict, profile_source: str, repo_source: str, match: re.Match, raw: str):
+    # A second path segment makes it a link to a repo (or a page of it), not to a profile.
+    candidates[repo_source if match.group(2) else profile_source].append((match.group(1), raw))
+
+
+def _trust_repo_owner(candidates: dict, profile_source: str, repo_source: str):
+    """Without a profile link, repo links are trusted when most of them share the owner."""
+    repos = [(username, raw) for username, raw in candidates[repo_source] if _valid(username)]
+    if candidates[profile_source] or not repos:
+        return
+    counts = Counter(username.lower() for username, _ in repos)
+    owner, count = counts.most_common(1)[0]
+    if count >= _REPO_OWNER_MIN_LINKS and count * 2 > len(repos):
+        candidates[profile_source] = [(username, raw) for username, raw in repos if username.lower() == owner]
+
+
+def find_github_handle(text: str, links: list[str] | None = None) -> dict | None:
+    """
+    Finds the candidate's GitHub username without an LLM, from the PDF's link annotations
+    first and then from URL, GitHub Pages and "GitHub: user" patterns in the text.
+    Returns {"username", "source", "match"} or None when nothing was found. Only handles from
+    TRUSTED_SOURCES are certain; repo-only and "text_label" matches should be confirmed by the LLM.
+    """
+    candidates = {source: [] for source in _SOURCES}
+
+    for link in links or []:
+        for match in _URL_PATTERN.finditer(link):
+            _add_url(candidates, "pdf_link", "pdf_repo_link", match, link)
+
+    for match in _URL_PATTERN.finditer(text or ""):
+        _add_url(candidates, "text_url", "text_repo_url", match, match.group(0))
+    _trust_repo_owner(candidates, "pdf_link", "pdf_repo_link")
+    _trust_repo_owner(candidates, "text_url", "text_repo_url")
+    for match in _PAGES_PATTERN.finditer(text or ""):
+        candidates["github_pages"].append((match.group(1), match.group(0)))
+    for match in _LABEL_PATTERN.finditer(text or ""):
+        candidates["text_label"].append((match.group(1), match.group(0).lstrip("•·*▪- \t")))
+
+    for source in _SOURCES:
+        found = [(username, raw) for username, raw in candidates[source] if _valid(username)]
+        if not found:
+            continue
+        # Links to several repos of the same user are common; the most frequent owner wins,
+        # ties go to the first one mentioned.
+        counts = Counter(username.lower() for username, _ in found)
+        best = max(counts, key=lambda name: (counts[name], -[u.lower() for u, _ in found].index(name)))
+        username, raw = next((u, r) for u, r in found if u.lower() == best)
+        return {"username": username, "source": source, "match": re.sub(r'\s+', '', raw)}
+    return None
@@ -0,0 +1,153 @@
+# app/services/github_name_search.py
+# Fallback for resumes without a GitHub link: the candidate's profile is looked up by name.
+# Search results are cached per name (including names without any match), and the profiles
+# found are ranked by how well their name, login and public email match the resume.
+import asyncio
+import os
+import re
+import unicodedata
+
+import httpx
+
+from app.services.sqlite_cache import CACHE_DIR, SQLiteCache
+from app.services.github_client import get_github_client
+
+NAME_SEARCH_CACHE_ENABLED = os.getenv("NAME_SEARCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+NAME_SEARCH_CACHE_PATH = os.getenv("NAME_SEARCH_CACHE_PATH", os.path.join(CACHE_DIR, "name_search.sqlite"))
+NAME_SEARCH_CACHE_MAX_MB = int(os.getenv("NAME_SEARCH_CACHE_MAX_MB", "64"))
+# How long search results are reused; names without any match are searched again sooner.
+NAME_SEARCH_CACHE_TTL = int(os.getenv("NAME_SEARCH_CACHE_TTL", str(30 * 86400)))
+NAME_SEARCH_NEGATIVE_TTL = int(os.getenv("NAME_SEARCH_NEGATIVE_TTL", str(7 * 86400)))
+# Search hits whose profiles are fetched and compared with the resume.
+NAME_SEARCH_CANDIDATES = int(os.getenv("NAME_SEARCH_CANDIDATES", "5"))
+# Profiles scoring below this are not taken (1.0 = the full name, an email or a name-like login matches).
+NAME_MATCH_MIN_SCORE = float(os.getenv("NAME_MATCH_MIN_SCORE", "1.0"))
+
+# Profile fields kept in the cache for ranking.
+_PROFILE_FIELDS = ("login", "html_url", "name", "email", "blog", "public_repos", "followers")
+
+
+def normalize_name(name: str | None) -> str:
+    """Lowercase name tokens without accents or punctuation ("José  O'Neil" -> "jose o neil")."""
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def score_profile(profile: dict, name: str, email: str | None = None) -> float:
+    """
+    How well a GitHub profile matches the resume, from fields the search already returned:
+    a matching public email is decisive, then the full name, then a login made of the name.
+    """
+    tokens = normalize_name(name).split()
+    score = 0.0
+    login = (profile.get("login") or "").lower()
+    if email:
+        email = email.strip().lower()
+        if (profile.get("email") or "").lower() == email:
+            score += 3.0
+        elif email.split("@")[0] == login:
+            score += 1.0
+
+    profile_tokens = normalize_name(profile.get("name")).split()
+    if tokens and profile_tokens:
+        if profile_tokens == tokens:
+            score += 2.0
+        elif set(tokens) <= set(profile_tokens):
+            score += 1.5  # e.g. an additional middle name on the profile
+        else:
+            score += len(set(tokens) & set(profile_tokens)) / len(set(tokens) | set(profile_tokens))
+    if tokens and login.replace("-", "") in ("".join(tokens), "".join(reversed(tokens))):
+        score += 1.0
+    return score
+
+
+class NameSearchCache:
+    """Persistent cache of name -> candidate profiles; an empty list records a name with no match."""
+
+    def __init__(self, store: SQLiteCache):
+        self.store = store
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0}
+
+    def load(self, name_key: str) -> list[dict] | None:
+        profiles = self.store.get_json(name_key)
+        if profiles is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits" if profiles else "negative_hits"] += 1
+        return profiles
+
+    def save(self, name_key: str, profiles: list[dict]):
+        self.store.set_json(name_key, profiles, ttl=NAME_SEARCH_CACHE_TTL if profiles else NAME_SEARCH_NEGATIVE_TTL)
+
+    def info(self) -> dict:
+        return {**self.stats, "store": self.store.info()}
+
+
+_cache: NameSearchCache | None = None
+
+
+def get_name_search_cache() -> NameSearchCache | None:
+    """Returns the process-wide name search cache, or None when it is disabled."""
+    global _cache
+    if not NAME_SEARCH_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = NameSearchCache(SQLiteCache(NAME_SEARCH_CACHE_PATH, NAME_SEARCH_CACHE_MAX_MB * 1024 * 1024))
+    return _cache
+
+
+async def search_profiles(name: str) -> list[dict]:
+    """
+    The user accounts GitHub finds for a name, with the public profile of the first
+    NAME_SEARCH_CANDIDATES hits. One search request (authenticated and scheduled on the
+    search quota by the shared client), then the profiles in parallel on the core quota.
+    """
+    client = get_github_client()
+    response = await client.get("/search/users", params={"q": f"{name} type:user", "per_page": NAME_SEARCH_CANDIDATES})
+    response.raise_for_status()
+    items = response.json().get("items") or []
+
+    responses = await asyncio.gather(
+        *(client.get(f"/users/{item['login']}") for item in items[:NAME_SEARCH_CANDIDATES]),
+        return_exceptions=True,
+    )
+    profiles = []
+    for item, profile_response in zip(items, responses):
+        profile = dict(item)
+        if isinstance(profile_response, httpx.Response) and profile_response.status_code == 200:
+            profile.update(profile_response.json())
+        profiles.append({field: profile.get(field) for field in _PROFILE_FIELDS})
+    return profiles
+
+
+async def find_github_profile_by_name(name: str, email: str | None = None) -> str | None:
+    """
+    Finds a GitHub profile URL based on a name (fallback), preferring the profile matching the resume best.
+    Raises httpx.HTTPError when the search fails, which unlike "no match" is worth retrying.
+    """
+    name_key = normalize_name(name)
+    if not name_key:
+        return None
+
+    cache = get_name_search_cache()
+    profiles = await asyncio.to_thread(cache.load, name_key) if cache is not None else None
+    if profiles is None:
+        # A failed search raises httpx.HTTPError and is not cached; the next resume with this name tries again.
+        profiles = await search_profiles(name)
+        if cache is not None:
+            await asyncio.to_thread(cache.save, name_key, profiles)
+
+    scored = [
+        (score_profile(profile, name, email), -position, profile)
+        for position, profile in enumerate(profiles)
+    ]
+    if not scored:
+        return None
+    score, _, best = max(scored, key=lambda entry: entry[:2])
+    if score < NAME_MATCH_MIN_SCORE:
+        print(f"No GitHub profile found for '{name}' matches the resume closely enough (best: {best['login']}, score {score:.1f}).")
+        return None
+    return best["html_url"] or f"https://github.com/{best['login']}"
@@ -0,0 +1,122 @@
+# app/services/github_rate_limiter.py
+import asyncio
+import os
+import time
+
+# Stop sending requests with a token once its remaining quota for a resource drops to this value.
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "25"))
+
+# Quotas assumed for a token before GitHub has reported the real numbers.
+DEFAULT_LIMITS = {"core": 5000, "graphql": 5000, "search": 30}
+ANONYMOUS_LIMITS = {"core": 60, "graphql": 0, "search": 10}
+
+
+def load_github_tokens() -> list[str]:
+    """Reads the token pool from GITHUB_TOKENS (comma-separated), falling back to GITHUB_TOKEN."""
+    tokens = [token.strip() for token in os.getenv("GITHUB_TOKENS", "").split(",") if token.strip()]
+    if not tokens and os.getenv("GITHUB_TOKEN"):
+        tokens = [os.getenv("GITHUB_TOKEN")]
+    return tokens
+
+
+class RateLimitScheduler:
+    """
+    Central bookkeeping for all GitHub traffic.
+    Tracks the remaining quota of every token per rate-limit resource (core, search, graphql)
+    from the X-RateLimit-* response headers, hands out the token with the most headroom, and
+    makes callers wait for the reset *before* a token is exhausted instead of running into 403s.
+    """
+
+    def __init__(self, tokens: list[str], reserve: int = GITHUB_RATE_LIMIT_RESERVE):
+        self.tokens = tokens
+        self.reserve = reserve
+        # With no token configured, requests go out unauthenticated under one shared bucket.
+        self._states = {token: {} for token in tokens} if tokens else {None: {}}
+
+    def _bucket(self, token: str | None, resource: str) -> dict:
+        buckets = self._states[token]
+        if resource not in buckets:
+            limits = DEFAULT_LIMITS if token else ANONYMOUS_LIMITS
+            limit = limits.get(resource, DEFAULT_LIMITS["core"])
+            buckets[resource] = {"limit": limit, "remaining": limit, "reset": 0.0, "in_flight": 0}
+        bucket = buckets[resource]
+        if bucket["reset"] and bucket["reset"] <= time.time():
+            # The window has rolled over; the next response will report the exact numbers.
+            bucket["remaining"] = bucket["limit"]
+            bucket["reset"] = 0.0
+        return bucket
+
+    def _headroom(self, token: str | None, resource: str) -> int:
+        bucket = self._bucket(token, resource)
+        return bucket["remaining"] - bucket["in_flight"]
+
+    async def acquire(self, resource: str = "core") -> str | None:
+        """
+        Reserves one request on the token with the most remaining quota for `resource`.
+        If every token is down to its reserve, waits until the earliest reset.
+        """
+        while True:
+            token = max(self._states, key=lambda t: self._headroom(t, resource))
+            # The anonymous bucket is small, so only keep a reserve for real tokens; small
+            # buckets (search: 30 per minute) keep at most a tenth of their limit in reserve.
+            reserve = min(self.reserve, self._bucket(token, resource)["limit"] // 10) if token else 0
+            if self._headroom(token, resource) > reserve:
+                self._bucket(token, resource)["in_flight"] += 1
+                return token
+
+            resets = [self._bucket(t, resource)["reset"] for t in self._states]
+            resets = [reset for reset in resets if reset] or [time.time() + 60]
+            wait = max(1.0, min(resets) - time.time() + 1)
+            print(f"GitHub '{resource}' quota is low on all {len(self._states)} token(s). Waiting {wait:.0f}s for the reset.")
+            await asyncio.sleep(wait)
+
+    def release(self, token: str | None, resource: str, headers=None):
+        """Ends a reservation and updates the quota from the response headers, if any."""
+        bucket = self._bucket(token, resource)
+        bucket["in_flight"] = max(0, bucket["in_flight"] - 1)
+        if headers is None or headers.get("X-RateLimit-Remaining") is None:
+            return
+        # GitHub reports which bucket the request was counted against.
+        bucket = self._bucket(token, headers.get("X-RateLimit-Resource", resource))
+        try:
+            bucket["remaining"] = int(headers["X-RateLimit-Remaining"])
+            bucket["limit"] = int(headers.get("X-RateLimit-Limit", bucket["limit"]))
+            bucket["reset"] = float(headers.get("X-RateLimit-Reset", bucket["reset"]))
+        except ValueError:
+            pass
+
+    def exhaust(self, token: str | None, resource: str, retry_after: float):
+        """Marks a token as unusable for `retry_after` seconds (secondary rate limits)."""
+        bucket = self._bucket(token, resource)
+        bucket["remaining"] = 0
+        bucket["reset"] = max(bucket["reset"], time.time() + retry_after)
+
+    def snapshot(self) -> list[dict]:
+        """Returns the known quota of every token, with the tokens masked."""
+        state = []
+        for token, buckets in self._states.items():
+            name = f"...{token[-4:]}" if token else "anonymous"
+            state.append({
+                "token": name,
+                "resources": {
+                    resource: {
+                        "limit": bucket["limit"],
+                        "remaining": bucket["remaining"],
+                        "in_flight": bucket["in_flight"],
+                        "reset": int(bucket["reset"]) or None,
+                    }
+                    for resource, bucket in buckets.items()
+                },
+            })
+        return state
+
+
+_scheduler: RateLimitScheduler | None = None
+
+
+def get_rate_limit_scheduler() -> RateLimitScheduler:
+    """Returns the process-wide scheduler for the configured token pool."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RateLimitScheduler(load_github_tokens())
+    return _scheduler
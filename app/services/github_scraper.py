@@ -1,96 +1,157 @@
 # app/services/github_scraper.py
-import requests
+import httpx
+import asyncio
 import os
 import base64
-import json
+import math
 
+from app.services.github_client import GitHubClient, get_github_client
+from app.services.github_graphql import get_github_data_graphql
+from app.services.github_name_search import find_github_profile_by_name
+from app.services.github_rate_limiter import get_rate_limit_scheduler
+from app.services.repo_ranking import rank_repos
+from app.services.repo_cache import get_repo_cache
+from app.agents.context_builder import excerpt_readme
 
-def get_github_data(username: str) -> dict:
-    """Fetches public user and repository data from the GitHub API."""
-    github_token = os.getenv("GITHUB_TOKEN")
+# Which GitHub API is used to collect profile data: "rest" or "graphql".
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest").lower()
+# Pages of 100 repositories listed per user (the listing is cheap; up to 1000 repos by default).
+GITHUB_MAX_REPO_PAGES = int(os.getenv("GITHUB_MAX_REPO_PAGES", "10"))
+# Most relevant repositories whose README and commits are fetched; the others are kept from the listing only.
+GITHUB_DEEP_FETCH_REPOS = int(os.getenv("GITHUB_DEEP_FETCH_REPOS", "10"))
+# Most repositories kept in the GitHub data of a candidate.
+GITHUB_MAX_PROJECTS = int(os.getenv("GITHUB_MAX_PROJECTS", "50"))
+# Commits shown per repository.
+GITHUB_COMMITS_PER_REPO = 3
+REPOS_PER_PAGE = 100
 
-    if not github_token:
+
+async def get_github_data(username: str, job_description: str | None = None) -> dict:
+    """
+    Fetches public user and repository data from the GitHub API.
+    With a job description, the repositories most relevant to it are the ones fetched in depth.
+    """
+    if not get_rate_limit_scheduler().tokens:
         return {"error": "GitHub token not set."}
-    
-    headers = {"Authorization": f"token {github_token}"}
+
+    if GITHUB_BACKEND == "graphql":
+        return await get_github_data_graphql(username, job_description, GITHUB_MAX_PROJECTS)
+    return await _get_github_data_rest(username, job_description)
+
+
+async def _get_github_data_rest(username: str, job_description: str | None = None) -> dict:
+    """
+    REST backend: the user, all repos (100 per page), then README and commits for the
+    GITHUB_DEEP_FETCH_REPOS repos that score best for the job (stars and recency without one).
+    """
+    client = get_github_client()
     
     try:
-        user_url = f"https://api.github.com/users/{username}"
-        user_response = requests.get(user_url, headers=headers)
+        user_response = await client.get(f"/users/{username}")
         user_response.raise_for_status()
         
-        print("\n--- GitHub API Rate Limit ---")
-        print(f"Limit: {user_response.headers.get('X-RateLimit-Limit')}")
-        print(f"Remaining: {user_response.headers.get('X-RateLimit-Remaining')}")
-        print(f"Reset: {user_response.headers.get('X-RateLimit-Reset')}")
-        print("-----------------------------\n")
-        
         user_data = user_response.json()
         
-        repos_url = f"https://api.github.com/users/{username}/repos"
-        repos_response = requests.get(repos_url, headers=headers)
-        repos_response.raise_for_status()
-        repos_data = repos_response.json()
-        
-        projects = []
-        if isinstance(repos_data, list):
-            # --- NEW: Iterate and get more detailed info for each repo ---
-            for repo in repos_data:
-                repo_name = repo.get("name")
-                project_info = {
-                    "name": repo_name,
-                    "description": repo.get("description"),
-                    "language": repo.get("language"),
-                    "stars": repo.get("stargazers_count"),
-                    "readme_content": None,
-                    "recent_commits": []
-                }
-                
-                # Fetch README.md content
-                readme_url = f"https://api.github.com/repos/{username}/{repo_name}/readme"
-                readme_response = requests.get(readme_url, headers=headers)
-                if readme_response.status_code == 200:
-                    readme_data = readme_response.json()
-                    # The content is Base64 encoded, so we need to decode it
-                    readme_content = base64.b64decode(readme_data.get("content")).decode('utf-8')
-                    project_info["readme_content"] = readme_content
-
-                # Fetch recent commits
-                commits_url = f"https://api.github.com/repos/{username}/{repo_name}/commits"
-                commits_response = requests.get(commits_url, headers=headers)
-                if commits_response.status_code == 200:
-                    commits_data = commits_response.json()
-                    for commit in commits_data[:3]: # Get the last 3 commits
-                        project_info["recent_commits"].append({
-                            "message": commit.get("commit").get("message"),
-                            "sha": commit.get("sha")[:7]
-                        })
-                
-                projects.append(project_info)
+        repos_data = await _list_repos(client, username, user_data.get("public_repos"))
+        ranked = rank_repos(repos_data, job_description or "")[:GITHUB_MAX_PROJECTS]
+        deep, shallow = ranked[:GITHUB_DEEP_FETCH_REPOS], ranked[GITHUB_DEEP_FETCH_REPOS:]
+
+        # README and commits of the selected repos are fetched in parallel over the shared connection pool
+        projects = await asyncio.gather(
+            *(_fetch_project_details(client, username, repo) for repo in deep)
+        )
         
         return {
             "username": user_data.get("login"),
             "public_repos": user_data.get("public_repos"),
-            "projects": projects,
+            "projects": list(projects) + [_project_entry(repo) for repo in shallow],
             "followers": user_data.get("followers")
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {e}"}
 
-def find_github_profile_by_name(name: str) -> str | None:
-    """Finds a GitHub profile URL based on a name (fallback)."""
-    search_query = name.replace(" ", "+")
-    search_url = f"https://api.github.com/search/users?q={search_query}"
-    
-    try:
-        response = requests.get(search_url)
+
+async def _list_repos(client: GitHubClient, username: str, public_repos: int | None) -> list[dict]:
+    """
+    All repositories of a user, 100 per page. The page count follows from the profile's
+    public_repos, so the pages are requested in parallel; the Link header covers a stale count.
+    """
+    pages = min(max(1, math.ceil((public_repos or 0) / REPOS_PER_PAGE)), GITHUB_MAX_REPO_PAGES)
+    responses = await asyncio.gather(*(
+        client.get(f"/users/{username}/repos", params={"per_page": REPOS_PER_PAGE, "page": page, "sort": "pushed"})
+        for page in range(1, pages + 1)
+    ))
+    while "next" in responses[-1].links and len(responses) < GITHUB_MAX_REPO_PAGES:
+        responses.append(await client.get(
+            f"/users/{username}/repos", params={"per_page": REPOS_PER_PAGE, "page": len(responses) + 1, "sort": "pushed"}
+        ))
+
+    repos = []
+    for response in responses:
         response.raise_for_status()
-        search_results = response.json()
-        if search_results["items"]:
-            return search_results["items"][0]["html_url"]
-    except requests.exceptions.RequestException as e:
-        print(f"Error during GitHub profile search: {e}")
-    return None
+        page = response.json()
+        if isinstance(page, list):
+            repos.extend(page)
+    return repos
+
+
+def _project_entry(repo: dict) -> dict:
+    """The project entry of a repo as far as the listing describes it."""
+    return {
+        "name": repo.get("name"),
+        "description": repo.get("description"),
+        "language": repo.get("language"),
+        "stars": repo.get("stargazers_count"),
+        "fork": repo.get("fork", False),
+        "pushed_at": repo.get("pushed_at"),
+        "readme_content": None,
+        "readme_excerpt": None,
+        "recent_commits": []
+    }
+
+
+async def _fetch_project_details(client: GitHubClient, username: str, repo: dict) -> dict:
+    """
+    Builds the project entry for one repo, fetching its README and recent commits concurrently.
+    Repos that have not been pushed to since they were last fetched come from the repo cache.
+    """
+    repo_name = repo.get("name")
+    project_info = _project_entry(repo)
+
+    cache = get_repo_cache()
+    full_name = repo.get("full_name") or f"{username}/{repo_name}"
+    cached = await asyncio.to_thread(cache.load, full_name, repo.get("pushed_at")) if cache is not None else None
+    if cached is not None:
+        project_info.update(cached)
+        return project_info
+
+    readme_response, commits_response = await asyncio.gather(
+        client.get(f"/repos/{username}/{repo_name}/readme"),
+        client.get(f"/repos/{username}/{repo_name}/commits", params={"per_page": GITHUB_COMMITS_PER_REPO}),
+    )
+
+    if readme_response.status_code == 200:
+        readme_data = readme_response.json()
+        # The content is Base64 encoded, so we need to decode it
+        readme_content = base64.b64decode(readme_data.get("content")).decode('utf-8', errors='replace')
+        project_info["readme_content"] = readme_content
+        project_info["readme_excerpt"] = excerpt_readme(readme_content)
+
+    if commits_response.status_code == 200:
+        commits_data = commits_response.json()
+        for commit in commits_data[:GITHUB_COMMITS_PER_REPO]: # Get the last 3 commits
+            project_info["recent_commits"].append({
+                "message": commit.get("commit").get("message"),
+                "sha": commit.get("sha")[:7]
+            })
+
+    # 404: no README; 409: an empty repository. Errors and rate limiting are not cached.
+    if cache is not None and readme_response.status_code in (200, 404) and commits_response.status_code in (200, 404, 409):
+        await asyncio.to_thread(cache.save, full_name, repo.get("pushed_at"), {
+            key: project_info[key] for key in ("readme_content", "readme_excerpt", "recent_commits")
+        })
+
+    return project_info
 
 
 
@@ -0,0 +1,181 @@
+# app/services/jobs.py
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from app.services.screening import iter_screen_resumes, start_job
+from app.services.archive import ResumeArchive
+from app.services.candidate_store import get_candidate_store
+
+# Candidates screened at the same time across all background jobs.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "8"))
+
+# Least seconds between two writes of a running job's status file (the final state is always written).
+JOB_STATUS_INTERVAL = float(os.getenv("JOB_STATUS_INTERVAL", "2"))
+
+# A job of another process whose status file has not changed for this long is reported as interrupted.
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "600"))
+
+# Seconds a finished job stays in memory; afterwards it is read from its status file.
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "300"))
+
+# State of the jobs started by this process, by job_description_id.
+_jobs: dict[str, dict] = {}
+# Keeps the running job tasks referenced until they finish.
+_tasks: set[asyncio.Task] = set()
+_worker_slots: asyncio.Semaphore | None = None
+# When each job's status file was last written (time.monotonic()).
+_status_saved_at: dict[str, float] = {}
+
+
+def _get_worker_slots() -> asyncio.Semaphore:
+    global _worker_slots
+    if _worker_slots is None:
+        _worker_slots = asyncio.Semaphore(max(1, JOB_WORKERS))
+    return _worker_slots
+
+
+def _job_dir(job_id: str) -> str:
+    return f"data_output/{job_id}"
+
+
+def _write_status(job_id: str, data: str):
+    """Writes the job state next to the candidate records (atomically, so readers never see half a file)."""
+    path = f"{_job_dir(job_id)}/job_status.json"
+    with open(path + ".tmp", "w") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+
+async def _save_status(job: dict, force: bool = False):
+    """
+    Saves the job state at most every JOB_STATUS_INTERVAL seconds, or now with `force`.
+    The state is serialized on the event loop, which is the only place it changes, and written
+    to disk in a worker thread.
+    """
+    job_id = job["job_description_id"]
+    now = time.monotonic()
+    if not force and now - _status_saved_at.get(job_id, 0.0) < JOB_STATUS_INTERVAL:
+        return
+    _status_saved_at[job_id] = now
+    await asyncio.to_thread(_write_status, job_id, json.dumps(job))
+
+
+async def submit_job(job_description: str, uploads: list[tuple[str, bytes]], archive: ResumeArchive | None = None) -> dict:
+    """
+    Registers a screening job and starts it in the background.
+    Returns the initial job state, including the job_description_id to poll.
+    The resumes of `archive` follow the uploads; they are added to the job as they are read.
+    """
+    job_id = await asyncio.to_thread(start_job, job_description)
+    job = {
+        "job_description_id": job_id,
+        "status": "queued",
+        "created_at": time.time(),
+        "finished_at": None,
+        "total": len(uploads) if archive is None else None,
+        "completed": 0,
+        "failed": 0,
+        "candidates": [
+            {"index": index, "filename": filename, "status": "pending", "candidate_id": None}
+            for index, (filename, _) in enumerate(uploads)
+        ],
+    }
+    _jobs[job_id] = job
+    await _save_status(job, force=True)
+
+    resumes = uploads if archive is None else _job_resumes(job, uploads, archive)
+    task = asyncio.create_task(_run_job(job, job_description, resumes))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+async def _job_resumes(job: dict, uploads: list[tuple[str, bytes]], archive: ResumeArchive):
+    """
+    The uploads, then the resumes of the archive. The archive is read in a worker thread, but the
+    pending entry of every resume is added here, on the event loop, where the job state is saved and read.
+    """
+    for upload in uploads:
+        yield upload
+    iterator = iter(archive)
+    while (resume := await asyncio.to_thread(next, iterator, None)) is not None:
+        job["candidates"].append({"index": len(job["candidates"]), "filename": resume[0], "status": "pending", "candidate_id": None})
+        yield resume
+    job["total"] = len(job["candidates"])
+    job["archive"] = dict(archive.stats)
+
+
+async def _run_job(job: dict, job_description: str, resumes):
+    job["status"] = "running"
+    await _save_status(job, force=True)
+    try:
+        async for index, candidate_data in iter_screen_resumes(
+            resumes, job_description, job["job_description_id"], semaphore=_get_worker_slots()
+        ):
+            entry = job["candidates"][index]
+            job["completed"] += 1
+            if candidate_data:
+                ranking = candidate_data.get("prerank")
+                entry["status"] = "skipped" if ranking and not ranking["shortlisted"] else "done"
+                entry["candidate_id"] = candidate_data["candidate_id"]
+            else:
+                entry["status"] = "failed"
+                job["failed"] += 1
+            await _save_status(job)
+        job["status"] = "completed" if job["completed"] > job["failed"] else "failed"
+    except Exception as e:
+        print(f"Error running job {job['job_description_id']}: {e}")
+        job["status"] = "error"
+        job["error"] = str(e)
+    finally:
+        job["finished_at"] = time.time()
+        await _save_status(job, force=True)
+        _status_saved_at.pop(job["job_description_id"], None)
+        asyncio.get_running_loop().call_later(JOB_RETENTION_SECONDS, _jobs.pop, job["job_description_id"], None)
+
+
+def get_job(job_id: str, include_results: bool = True) -> dict | None:
+    """
+    Returns the status and per-candidate progress of a job, together with the finished
+    candidate records from the candidate store. None if the job does not exist.
+    """
+    try:
+        job_id = str(uuid.UUID(job_id))
+    except ValueError:
+        return None
+
+    job = _jobs.get(job_id)
+    if job is None:
+        # A job started by another worker or before a restart: use the state on disk.
+        status_path = f"{_job_dir(job_id)}/job_status.json"
+        if not os.path.exists(status_path):
+            return None
+        with open(status_path) as f:
+            job = json.load(f)
+        if job["status"] in ("queued", "running") and time.time() - os.path.getmtime(status_path) > JOB_STALE_SECONDS:
+            job["status"] = "interrupted"
+
+    job = {**job, "candidates": [dict(entry) for entry in job["candidates"]]}
+    if include_results:
+        # Finished candidates in upload order
+        order = {entry["candidate_id"]: entry["index"] for entry in job["candidates"] if entry["candidate_id"]}
+        results = get_candidate_store().list_candidates(job_id)
+        results.sort(key=lambda result: order.get(result.get("candidate_id"), len(order)))
+        job["results"] = results
+    return job
+
+
+def get_job_candidates(job_id: str) -> tuple[str, list[dict]] | None:
+    """The job description and all stored candidate records of a job. None if the job does not exist."""
+    try:
+        job_id = str(uuid.UUID(job_id))
+    except ValueError:
+        return None
+    store = get_candidate_store()
+    job_description = store.get_job_description(job_id)
+    if job_description is None:
+        return None
+    return job_description, store.list_candidates(job_id)
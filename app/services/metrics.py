@@ -0,0 +1,177 @@
+# app/services/metrics.py
+# Process-wide counters and histograms in the Prometheus text format, plus per-candidate
+# timings and usage collected through a context variable (so worker threads started with
+# asyncio.to_thread, which copy the context, report into the right candidate).
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# USD per million tokens, used for the cost estimate (defaults: gpt-4o-mini).
+LLM_INPUT_PRICE_PER_MTOK = float(os.getenv("LLM_INPUT_PRICE_PER_MTOK", "0.15"))
+LLM_OUTPUT_PRICE_PER_MTOK = float(os.getenv("LLM_OUTPUT_PRICE_PER_MTOK", "0.60"))
+
+_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{str(value)}"'.replace("\n", " ") for name, value in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = _DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., sum, count]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[position] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                for position, bound in enumerate(self.buckets):
+                    labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{labels} {state[position]}")
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {state[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}")
+        return lines
+
+
+STAGE_SECONDS = Histogram("smartscan_stage_seconds", "Time spent in each pipeline stage.", ("stage",))
+CANDIDATES = Counter("smartscan_candidates_total", "Screened candidates by outcome.", ("outcome",))
+LLM_CALLS = Counter("smartscan_llm_calls_total", "LLM calls by stage, answered by the model or the cache.", ("stage", "cached"))
+LLM_TOKENS = Counter("smartscan_llm_tokens_total", "LLM tokens sent to and received from the model.", ("stage", "type"))
+LLM_COST = Counter("smartscan_llm_cost_usd_total", "Estimated LLM cost in USD.", ("stage",))
+GITHUB_REQUESTS = Counter(
+    "smartscan_github_requests_total", "GitHub API requests by rate-limit resource and status (cached = served locally).",
+    ("resource", "status"),
+)
+
+_METRICS = (STAGE_SECONDS, CANDIDATES, LLM_CALLS, LLM_TOKENS, LLM_COST, GITHUB_REQUESTS)
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# Timings and usage of the candidate being processed in the current context.
+_candidate_metrics: contextvars.ContextVar[dict | None] = contextvars.ContextVar("candidate_metrics", default=None)
+# Name of the stage running in the current context (labels the LLM and GitHub counters).
+_current_stage: contextvars.ContextVar[str] = contextvars.ContextVar("current_stage", default="other")
+
+
+def start_candidate_metrics() -> dict:
+    """
+    Starts collecting timings and usage for one candidate in the current context (one asyncio task).
+    Returns the dict that is filled in as the candidate is processed.
+    """
+    metrics = {
+        "timings": {},
+        "usage": {
+            "llm_calls": 0,
+            "llm_cached_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cost_usd": 0.0,
+            "github_requests": 0,
+            "github_cached_requests": 0,
+        },
+    }
+    _candidate_metrics.set(metrics)
+    return metrics
+
+
+def add_stage_time(timings: dict, stage_name: str, seconds: float):
+    timings[stage_name] = round(timings.get(stage_name, 0.0) + seconds, 4)
+
+
+@contextmanager
+def stage(name: str):
+    """Times a pipeline stage: `with stage("github_fetch"): ...` (also around awaits)."""
+    token = _current_stage.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _current_stage.reset(token)
+        STAGE_SECONDS.observe(elapsed, stage=name)
+        metrics = _candidate_metrics.get()
+        if metrics is not None:
+            add_stage_time(metrics["timings"], name, elapsed)
+
+
+def record_llm_call(usage: dict | None, cached: bool):
+    """Counts an LLM call; `usage` has input_tokens / output_tokens (None for cached answers)."""
+    stage_name = _current_stage.get()
+    LLM_CALLS.inc(stage=stage_name, cached=str(cached).lower())
+    metrics = _candidate_metrics.get()
+    if metrics is not None:
+        metrics["usage"]["llm_cached_calls" if cached else "llm_calls"] += 1
+    if cached or not usage:
+        return
+
+    prompt_tokens = usage.get("input_tokens") or 0
+    completion_tokens = usage.get("output_tokens") or 0
+    cost = (prompt_tokens * LLM_INPUT_PRICE_PER_MTOK + completion_tokens * LLM_OUTPUT_PRICE_PER_MTOK) / 1_000_000
+    LLM_TOKENS.inc(prompt_tokens, stage=stage_name, type="prompt")
+    LLM_TOKENS.inc(completion_tokens, stage=stage_name, type="completion")
+    LLM_COST.inc(cost, stage=stage_name)
+    if metrics is not None:
+        metrics["usage"]["prompt_tokens"] += prompt_tokens
+        metrics["usage"]["completion_tokens"] += completion_tokens
+        metrics["usage"]["cost_usd"] = round(metrics["usage"]["cost_usd"] + cost, 6)
+
+
+def record_github_request(resource: str, status: str):
+    GITHUB_REQUESTS.inc(resource=resource, status=status)
+    metrics = _candidate_metrics.get()
+    if metrics is not None:
+        metrics["usage"]["github_cached_requests" if status == "cached" else "github_requests"] += 1
@@ -0,0 +1,183 @@
+# app/services/pdf_extractor.py
+# pypdf is CPU-bound pure Python, so documents are parsed in a pool of worker processes.
+# Keep this module free of heavy imports: every worker process imports it on start-up.
+import asyncio
+import io
+import multiprocessing
+import os
+import signal
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Number of worker processes; 0 parses in a thread of the server process instead.
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(os.cpu_count() or 1)))
+# Hard limit for parsing one document, in seconds.
+PDF_TIMEOUT = float(os.getenv("PDF_TIMEOUT", "20"))
+# Only the first pages are read; resumes rarely have more.
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+PDF_MAX_MB = float(os.getenv("PDF_MAX_MB", "10"))
+
+
+class PDFTimeout(BaseException):
+    """Raised inside a worker when a document exceeds PDF_TIMEOUT.
+    Derived from BaseException so the generic error handling of the extractor cannot swallow it."""
+
+
+def extract_pdf_content(pdf_bytes: bytes, max_pages: int | None = None) -> dict:
+    """Extracts the text and the hyperlink targets (/Annots URI entries) of a PDF file."""
+    # Imported on first use: the server process itself rarely parses PDFs
+    import pypdf
+
+    content = {"text": "", "links": [], "pages": 0, "truncated": False}
+    try:
+        pdf_reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+        pages = pdf_reader.pages
+        content["pages"] = len(pages)
+        if max_pages is not None and len(pages) > max_pages:
+            content["truncated"] = True
+        text = ""
+        for index, page in enumerate(pages):
+            if max_pages is not None and index >= max_pages:
+                break
+            text += page.extract_text() or ""
+            content["links"].extend(_page_links(page))
+        content["text"] = text
+    except Exception as e:
+        print(f"Error extracting text from PDF: {e}")
+    return content
+
+
+def _page_links(page) -> list[str]:
+    links = []
+    try:
+        for annotation in page.get("/Annots") or []:
+            annotation = annotation.get_object()
+            if annotation.get("/Subtype") != "/Link":
+                continue
+            action = annotation.get("/A")
+            uri = action.get_object().get("/URI") if action is not None else None
+            if uri:
+                links.append(str(uri))
+    except Exception as e:
+        print(f"Error reading PDF link annotations: {e}")
+    return links
+
+
+def _raise_timeout(signum, frame):
+    raise PDFTimeout()
+
+
+def _extract_in_worker(pdf_bytes: bytes, max_pages: int, timeout: float) -> dict:
+    """Runs in a worker process. SIGALRM interrupts documents that take longer than `timeout`."""
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return extract_pdf_content(pdf_bytes, max_pages)
+    except PDFTimeout:
+        return {"text": "", "links": [], "pages": 0, "truncated": False, "error": "timeout"}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # "spawn" avoids forking a process that already runs threads and an event loop.
+        _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _kill_pool(pool: ProcessPoolExecutor):
+    """Terminates all workers of a pool (a stuck worker cannot be cancelled otherwise)."""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    # ProcessPoolExecutor has no public API to kill its workers.
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def extract_pdf(pdf_bytes: bytes) -> dict:
+    """
+    Extracts text and links from a PDF in the worker pool, with a page cap, a size cap and a
+    hard per-document timeout. The result reports `elapsed_ms` and, for skipped or failed
+    documents, an `error`.
+    """
+    start = time.perf_counter()
+    content = None
+    if len(pdf_bytes) > PDF_MAX_MB * 1024 * 1024:
+        print(f"Warning: PDF of {len(pdf_bytes) / 1024 / 1024:.1f} MB exceeds PDF_MAX_MB. Skipping extraction.")
+        content = {"text": "", "links": [], "pages": 0, "truncated": False, "error": "too_large"}
+    elif PDF_WORKERS <= 0:
+        content = await asyncio.to_thread(_extract_in_worker_thread, pdf_bytes)
+    else:
+        content = await _extract_in_pool(pdf_bytes)
+
+    content["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return content
+
+
+def _extract_in_worker_thread(pdf_bytes: bytes) -> dict:
+    # Signals only work in the main thread, so there is no hard timeout here.
+    return extract_pdf_content(pdf_bytes, PDF_MAX_PAGES)
+
+
+# Documents handed to the pool at once, per event loop. Submitting no more documents than there
+# are workers means a document starts running when it is submitted, so the timeout below measures
+# execution time only, not time spent queued behind other documents.
+_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(PDF_WORKERS)
+    return slots
+
+
+def _cancelled_by_caller() -> bool:
+    """True if the running task itself is being cancelled (and not just its pool future)."""
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+async def _extract_in_pool(pdf_bytes: bytes) -> dict:
+    loop = asyncio.get_running_loop()
+    async with _get_slots():
+        # Retries: the pool may have been torn down because of another document.
+        for attempt in range(3):
+            pool = _get_pool()
+            future = loop.run_in_executor(pool, _extract_in_worker, pdf_bytes, PDF_MAX_PAGES, PDF_TIMEOUT)
+            try:
+                # The alarm in the worker normally fires first; this catches workers stuck outside Python code.
+                return await asyncio.wait_for(future, PDF_TIMEOUT + 5)
+            except asyncio.TimeoutError:
+                print("Warning: PDF extraction did not finish in time. Restarting the PDF worker pool.")
+                _kill_pool(pool)
+                return {"text": "", "links": [], "pages": 0, "truncated": False, "error": "timeout"}
+            except BrokenProcessPool:
+                # Another document crashed or timed out and took this pool down; submit again to a new one.
+                _kill_pool(pool)
+            except asyncio.CancelledError:
+                # Killing a pool cancels the documents still waiting in it; those are submitted again.
+                if pool is _pool or _cancelled_by_caller():
+                    raise
+    print("Warning: PDF worker crashed while extracting a document.")
+    return {"text": "", "links": [], "pages": 0, "truncated": False, "error": "worker_crashed"}
@@ -1,34 +1,18 @@
 # app/services/pdf_parser.py
 #----- New code using LLM only for GitHub URL extraction -----
-import pypdf
 import re
-from fastapi import UploadFile
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from dotenv import load_dotenv
 import os
 import json
 
-load_dotenv()
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-def extract_text_from_pdf(pdf_file: UploadFile) -> str:
-    """Extracts text from a PDF file."""
-    try:
-        pdf_reader = pypdf.PdfReader(pdf_file.file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() or ""
-        return text
-    except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
-        return ""
+from app.agents.llm import get_llm, get_prompt
+from app.agents.llm_cache import invoke_cached
+from app.services.pdf_extractor import extract_pdf_content
 
-def find_github_url_with_llm(text: str) -> str | None:
-    """
-    Identifies a GitHub URL within a given text string by relying on the LLM.
-    """
-    prompt_template = """
+def extract_text_from_pdf(pdf_bytes: bytes) -> str:
+    """Extracts text from the bytes of a PDF file."""
+    return extract_pdf_content(pdf_bytes)["text"]
+
+github_url_template = """
     From the following text, find and extract the candidate's GitHub profile URL. 
     The URL might be written as a full link (e.g., https://github.com/username), a shortened URL, or just a username.
     
@@ -46,21 +30,16 @@ def find_github_url_with_llm(text: str) -> str | None:
 
     Your response:
     """
-    
-    prompt = PromptTemplate(input_variables=["resume_text"], template=prompt_template)
-    chain = prompt | llm
 
-    try:
-        response = chain.invoke({"resume_text": text})
-        url = response.content.strip()
-        
-        if url.lower() == 'null':
-            return None
-        return url
-        
-    except Exception as e:
-        print(f"Error invoking LLM for URL extraction: {e}")
+def find_github_url_with_llm(text: str) -> str | None:
+    """
+    Identifies a GitHub URL within a given text string by relying on the LLM.
+    Errors of the LLM call are raised, so the caller can tell them apart from "no URL".
+    """
+    url = invoke_cached(get_prompt(github_url_template), get_llm(), {"resume_text": text}).strip()
+    if url.lower() == 'null':
         return None
+    return url
 
 #------- Old code using regex expression + LLM for validation -------
 # # app/services/pdf_parser.py
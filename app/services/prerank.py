@@ -0,0 +1,72 @@
+# app/services/prerank.py
+# Cheap local first stage: BM25 scores of all resume texts against the job description,
+# so only a shortlist goes through GitHub scraping and LLM evaluation.
+import os
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from app.services.repo_ranking import tokenize, job_terms
+
+# Only the K best scoring resumes are fully screened (0 = no limit).
+PRERANK_TOP_K = int(os.getenv("PRERANK_TOP_K", "0"))
+# Resumes with a lower BM25 score are not fully screened (0 = no threshold).
+PRERANK_MIN_SCORE = float(os.getenv("PRERANK_MIN_SCORE", "0"))
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def prerank_enabled() -> bool:
+    return PRERANK_TOP_K > 0 or PRERANK_MIN_SCORE > 0
+
+
+def bm25_scores(query: str, documents: list[str]) -> "np.ndarray":
+    """BM25 score of every document for the distinctive terms of `query`, computed over the batch at once."""
+    # numpy is imported on first use, so that it does not slow down the start of the app
+    import numpy as np
+
+    terms = sorted(job_terms(query))
+    scores = np.zeros(len(documents))
+    if not terms or not documents:
+        return scores
+
+    column = {term: position for position, term in enumerate(terms)}
+    tf = np.zeros((len(documents), len(terms)))
+    lengths = np.zeros(len(documents))
+    for row, document in enumerate(documents):
+        tokens = tokenize(document)
+        lengths[row] = len(tokens)
+        for term, count in Counter(tokens).items():
+            if term in column:
+                tf[row, column[term]] = count
+
+    n_docs = len(documents)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+    avg_length = lengths.mean() or 1.0
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+    scores = (idf * tf * (BM25_K1 + 1) / (tf + norm[:, None])).sum(axis=1)
+    return scores
+
+
+def prerank(job_description: str, documents: list[str], top_k: int = PRERANK_TOP_K, min_score: float = PRERANK_MIN_SCORE) -> list[dict]:
+    """
+    Ranks documents by BM25 score against the job description.
+    Returns one {"index", "score", "rank", "shortlisted"} entry per document, best first.
+    Documents in the top `top_k` (if set) scoring at least `min_score` (if set) are shortlisted.
+    """
+    import numpy as np
+
+    scores = bm25_scores(job_description, documents)
+    # Empty documents go last, so they never take a place in the top K
+    has_text = np.array([bool(document) for document in documents], dtype=bool)
+    order = np.argsort(-np.where(has_text, scores, -np.inf), kind="stable")
+    ranking = []
+    for rank, index in enumerate(order):
+        score = float(scores[index])
+        shortlisted = (top_k <= 0 or rank < top_k) and score >= min_score and bool(has_text[index])
+        ranking.append({"index": int(index), "score": round(score, 4), "rank": rank + 1, "shortlisted": shortlisted})
+    return ranking
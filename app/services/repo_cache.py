@@ -0,0 +1,59 @@
+# app/services/repo_cache.py
+import os
+
+from app.services.sqlite_cache import CACHE_DIR, SQLiteCache
+from app.agents.context_builder import README_EXCERPT_TOKENS
+
+REPO_CACHE_ENABLED = os.getenv("REPO_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+REPO_CACHE_PATH = os.getenv("REPO_CACHE_PATH", os.path.join(CACHE_DIR, "repos.sqlite"))
+REPO_CACHE_MAX_MB = int(os.getenv("REPO_CACHE_MAX_MB", "256"))
+
+
+class RepoDataCache:
+    """
+    Per-repository data derived from the GitHub API (decoded README, its excerpt for the
+    evaluator and the latest commits), keyed by owner/repo and the `pushed_at` of the repo
+    listing. A push changes `pushed_at` and with it the key, so entries never need to be
+    revalidated: a repo that has not changed costs no request, for any candidate or job.
+    """
+
+    def __init__(self, store: SQLiteCache):
+        self.store = store
+        # The excerpt length is part of the key, so changing it does not serve old excerpts.
+        self.version = f"x{README_EXCERPT_TOKENS}"
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+
+    def _key(self, full_name: str, pushed_at: str) -> str:
+        return f"{self.version}:{full_name.lower()}@{pushed_at}"
+
+    def load(self, full_name: str, pushed_at: str | None) -> dict | None:
+        """The cached data of a repo as of `pushed_at`, or None (always None without a `pushed_at`)."""
+        if not pushed_at:
+            return None
+        data = self.store.get_json(self._key(full_name, pushed_at))
+        self.stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    def save(self, full_name: str, pushed_at: str | None, data: dict):
+        if not pushed_at:
+            return
+        self.store.set_json(self._key(full_name, pushed_at), data)
+        self.stats["stored"] += 1
+
+    def info(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / lookups if lookups else 0.0
+        return {**self.stats, "hit_rate": round(hit_rate, 4), "store": self.store.info()}
+
+
+_cache: RepoDataCache | None = None
+
+
+def get_repo_cache() -> RepoDataCache | None:
+    """Returns the process-wide repository data cache, or None when it is disabled."""
+    global _cache
+    if not REPO_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = RepoDataCache(SQLiteCache(REPO_CACHE_PATH, REPO_CACHE_MAX_MB * 1024 * 1024))
+    return _cache
@@ -0,0 +1,79 @@
+# app/services/repo_ranking.py
+import math
+import re
+import time
+from datetime import datetime
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "of", "on", "or", "our", "that", "the", "this", "to", "we", "will", "with", "you", "your",
+    "experience", "knowledge", "looking", "role", "skills", "strong", "team", "work", "working",
+    "ability", "good", "intern", "internship", "candidate", "candidates", "years", "plus",
+}
+
+# Weights of the ranking signals.
+RELEVANCE_WEIGHT = 3.0
+STARS_WEIGHT = 1.0
+RECENCY_WEIGHT = 1.0
+FORK_PENALTY = 1.5
+ARCHIVED_PENALTY = 1.0
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens, keeping tech spellings such as c++, c#, node.js or scikit-learn intact."""
+    return _WORD_PATTERN.findall((text or "").lower())
+
+
+def job_terms(job_description: str) -> set[str]:
+    """The distinctive words of a job description."""
+    return {word for word in tokenize(job_description) if word not in _STOPWORDS and len(word) > 1}
+
+
+def _age_days(timestamp: str | None, now: float) -> float | None:
+    if not timestamp:
+        return None
+    try:
+        pushed = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+    return max(0.0, (now - pushed) / 86400)
+
+
+def score_repo(repo: dict, terms: set[str], now: float | None = None) -> float:
+    """
+    Scores a repository for a job: overlap of its name, description, language, topics and
+    README opening with the job's terms, plus stars and recency, minus penalties for forks and archived repos.
+    Works on both raw GitHub listing entries and the project dicts of get_github_data.
+    """
+    now = now or time.time()
+    text = " ".join(
+        str(part) for part in (
+            (repo.get("name") or "").replace("-", " ").replace("_", " "),
+            repo.get("description") or "",
+            repo.get("language") or "",
+            " ".join(repo.get("topics") or []),
+            (repo.get("readme_content") or "")[:2000],
+        )
+    )
+    relevance = 0.0
+    if terms:
+        overlap = terms & set(tokenize(text))
+        relevance = len(overlap) / math.sqrt(len(terms))
+
+    stars = repo.get("stars", repo.get("stargazers_count")) or 0
+    stars_score = math.log1p(stars) / math.log1p(1000)
+
+    age = _age_days(repo.get("pushed_at"), now)
+    recency = math.exp(-age / 365) if age is not None else 0.0
+
+    penalty = (FORK_PENALTY if repo.get("fork") else 0.0) + (ARCHIVED_PENALTY if repo.get("archived") else 0.0)
+    return RELEVANCE_WEIGHT * relevance + STARS_WEIGHT * stars_score + RECENCY_WEIGHT * recency - penalty
+
+
+def rank_repos(repos: list[dict], job_description: str) -> list[dict]:
+    """Returns the repositories ordered from most to least relevant for the job."""
+    terms = job_terms(job_description)
+    now = time.time()
+    return sorted(repos, key=lambda repo: score_repo(repo, terms, now), reverse=True)
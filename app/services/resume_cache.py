@@ -0,0 +1,71 @@
+# app/services/resume_cache.py
+import os
+import hashlib
+
+from app.services.sqlite_cache import CACHE_DIR, SQLiteCache
+from app.services import pdf_parser
+from app.services import github_handle
+from app.agents import resume_parser
+from app.agents.llm import DEFAULT_MODEL
+
+RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESUME_CACHE_PATH = os.getenv("RESUME_CACHE_PATH", os.path.join(CACHE_DIR, "resumes.sqlite"))
+RESUME_CACHE_MAX_MB = int(os.getenv("RESUME_CACHE_MAX_MB", "256"))
+
+
+def pdf_fingerprint(pdf_bytes: bytes) -> str:
+    """SHA-256 of the uploaded PDF bytes; identical files share one cache entry."""
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def pipeline_version() -> str:
+    """
+    Fingerprint of everything that shapes the cached artifacts: the prompts and the models.
+    Changing any of them produces new cache keys, so old entries are never served again
+    (and age out of the store through eviction).
+    """
+    parts = [
+        github_handle.EXTRACTOR_VERSION,
+        resume_parser.RESUME_EXTRACTION_MODE,
+        resume_parser.template,
+        resume_parser.unified_template,
+        DEFAULT_MODEL,
+        pdf_parser.github_url_template,
+    ]
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class ResumeArtifactCache:
+    """
+    Content-addressed cache of everything derived from a resume PDF before evaluation:
+    the extracted text, the parsed resume JSON and the resolved GitHub username.
+    """
+
+    def __init__(self, store: SQLiteCache):
+        self.store = store
+        self.version = pipeline_version()
+
+    def _key(self, pdf_hash: str) -> str:
+        return f"{self.version}:{pdf_hash}"
+
+    def load(self, pdf_hash: str) -> dict | None:
+        return self.store.get_json(self._key(pdf_hash))
+
+    def save(self, pdf_hash: str, artifacts: dict):
+        self.store.set_json(self._key(pdf_hash), artifacts)
+
+    def info(self) -> dict:
+        return {"version": self.version, **self.store.info()}
+
+
+_cache: ResumeArtifactCache | None = None
+
+
+def get_resume_cache() -> ResumeArtifactCache | None:
+    """Returns the process-wide resume artifact cache, or None when it is disabled."""
+    global _cache
+    if not RESUME_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = ResumeArtifactCache(SQLiteCache(RESUME_CACHE_PATH, RESUME_CACHE_MAX_MB * 1024 * 1024))
+    return _cache
@@ -0,0 +1,616 @@
+# app/services/screening.py
+import asyncio
+import contextlib
+import os
+import time
+import uuid
+import re
+from typing import AsyncIterable, Iterable
+
+import httpx
+
+from app.services.pdf_parser import find_github_url_with_llm
+from app.services.pdf_extractor import extract_pdf
+from app.services.github_handle import find_github_handle, TRUSTED_SOURCES
+from app.services.github_scraper import get_github_data, find_github_profile_by_name
+from app.services.resume_cache import get_resume_cache, pdf_fingerprint
+from app.services.prerank import prerank, prerank_enabled
+from app.services.candidate_store import get_candidate_store
+from app.services.metrics import stage, start_candidate_metrics, add_stage_time, CANDIDATES
+from app.agents.resume_parser import parse_resume, RESUME_EXTRACTION_MODE
+from app.agents.evaluator import evaluate_candidate, evaluate_candidates_batch, EVALUATION_MODE, EVALUATION_BATCH_MAX
+
+# Maximum number of resumes that are processed at the same time.
+SCREEN_CONCURRENCY = int(os.getenv("SCREEN_CONCURRENCY", "8"))
+# Handles from the unified extraction below this confidence fall back to the name search.
+GITHUB_MIN_CONFIDENCE = float(os.getenv("GITHUB_MIN_CONFIDENCE", "0.5"))
+# Resumes read ahead of the screening, per unit of concurrency (bounds memory for lazy inputs such as archives).
+READ_AHEAD_FACTOR = int(os.getenv("READ_AHEAD_FACTOR", "2"))
+
+
+async def extract_resume(filename: str, pdf_bytes: bytes) -> dict:
+    """
+    The text of a resume, from the resume artifact cache or extracted from the PDF.
+    Returns {"pdf_sha256", "text", "cached" (the cached artifacts or None), "pdf_content"}.
+    """
+    cache = get_resume_cache()
+    pdf_hash = pdf_fingerprint(pdf_bytes)
+    if cache is not None:
+        artifacts = await asyncio.to_thread(cache.load, pdf_hash)
+        if artifacts is not None:
+            print(f"Resume cache hit for {filename}.")
+            return {"pdf_sha256": pdf_hash, "text": artifacts["raw_resume_text"], "cached": artifacts, "pdf_content": None}
+
+    # 1. Extract text and links from PDF (in the worker process pool)
+    with stage("pdf_extraction"):
+        pdf_content = await extract_pdf(pdf_bytes)
+    return {"pdf_sha256": pdf_hash, "text": pdf_content["text"], "cached": None, "pdf_content": pdf_content}
+
+
+def _extraction_info(pdf_content: dict) -> dict:
+    return {key: pdf_content.get(key) for key in ("pages", "truncated", "elapsed_ms", "error")}
+
+
+def _confirmed_source(username: str, label: dict | None, llm_source: str) -> str:
+    """The source of an LLM-found handle: the unconfirmed match's source (e.g. "text_label") when it agrees."""
+    if label is not None and username.lower() == label["username"].lower():
+        return label["source"]
+    return llm_source
+
+
+async def resolve_resume(filename: str, pdf_bytes: bytes, extracted: dict | None = None) -> dict:
+    """
+    Turns a resume PDF into the artifacts the evaluation needs: the extracted text,
+    the parsed resume data and the GitHub username (or None).
+    Known PDFs are served from the resume artifact cache without any pypdf or LLM work.
+    `extracted` is the result of extract_resume, if it already ran.
+    """
+    extracted = extracted or await extract_resume(filename, pdf_bytes)
+    pdf_hash = extracted["pdf_sha256"]
+    cache = get_resume_cache()
+    if extracted["cached"] is not None:
+        artifacts = extracted["cached"]
+        if artifacts.get("github_lookup_failed"):
+            # The parsed resume is reused; only the GitHub lookup that failed last time runs again.
+            artifacts = await _retry_github_lookup(filename, artifacts)
+            if not artifacts["github_lookup_failed"]:
+                await asyncio.to_thread(cache.save, pdf_hash, artifacts)
+        return {**artifacts, "pdf_sha256": pdf_hash, "cache_hit": True, "pdf_extraction": None}
+
+    artifacts = {
+        "raw_resume_text": "",
+        "parsed_resume_data": {},
+        "github_username": None,
+        "github_source": None,
+        "github_confidence": None,
+        "github_lookup_failed": False,
+    }
+
+    pdf_content = extracted["pdf_content"]
+    resume_text = pdf_content["text"]
+    artifacts["raw_resume_text"] = resume_text
+    extraction = _extraction_info(pdf_content)
+    print(f"Extracted {filename} in {extraction['elapsed_ms']} ms ({extraction['pages']} pages).")
+    if not resume_text:
+        return {**artifacts, "pdf_sha256": pdf_hash, "cache_hit": False, "pdf_extraction": extraction}
+
+    # 2. Fast path: GitHub handle from the PDF's hyperlinks or unambiguous text patterns
+    handle = find_github_handle(resume_text, pdf_content["links"])
+    label = None
+    if handle is not None and handle["source"] not in TRUSTED_SOURCES:
+        # A "GitHub: name" line may be a heading or a skills list, and a repo link may point to a
+        # library or an employer's project; the LLM has to confirm it.
+        label, handle = handle, None
+
+    # 3. Use the agent to parse the resume text. The LLM is only asked for the
+    # GitHub handle when the fast path found nothing.
+    unified = RESUME_EXTRACTION_MODE == "unified" and handle is None
+    with stage("resume_parse"):
+        parsed_resume_data = await asyncio.to_thread(parse_resume, resume_text, unified)
+    artifacts["parsed_resume_data"] = parsed_resume_data
+    candidate_name = parsed_resume_data.get('name') or os.path.splitext(filename)[0]
+
+    github_username = None
+    if handle is not None:
+        github_username = handle["username"]
+        artifacts["github_source"] = handle["source"]
+        artifacts["github_confidence"] = 1.0
+        print(f"Found GitHub handle for {candidate_name} in the PDF ({handle['source']}): {github_username}")
+    elif unified:
+        confidence = parsed_resume_data.get('github_confidence') or 0.0
+        if parsed_resume_data.get('github_username') and confidence >= GITHUB_MIN_CONFIDENCE:
+            github_username = parsed_resume_data['github_username']
+            artifacts["github_source"] = _confirmed_source(github_username, label, "llm_unified")
+            artifacts["github_confidence"] = confidence
+            print(f"Found GitHub handle for {candidate_name}: {github_username} (confidence {confidence:.2f})")
+    if github_username:
+        _set_github_username(artifacts, github_username)
+    else:
+        await _lookup_github_username(resume_text, candidate_name, label, artifacts)
+
+    # Only complete results are cached; a failed parse is retried next time.
+    # After a failed GitHub lookup the entry is kept, and the lookup is retried on the next hit.
+    if cache is not None and parsed_resume_data:
+        await asyncio.to_thread(cache.save, pdf_hash, artifacts)
+    return {**artifacts, "pdf_sha256": pdf_hash, "cache_hit": False, "pdf_extraction": extraction}
+
+
+def _set_github_username(artifacts: dict, github_username: str | None):
+    # GitHub usernames can only contain alphanumeric characters and hyphens.
+    if github_username and not re.match(r'^[a-zA-Z0-9-]+$', github_username):
+        print(f"Warning: Extracted username '{github_username}' is not a valid GitHub username. Skipping GitHub API call.")
+        github_username = None
+        artifacts["github_source"] = None
+    artifacts["github_username"] = github_username
+
+
+async def _lookup_github_username(resume_text: str, candidate_name: str, label: dict | None, artifacts: dict):
+    """
+    The slow ways to a GitHub handle, for resumes where the PDF and the parse found none:
+    the LLM URL search (outside the unified extraction mode), then the search by name.
+    Sets `github_lookup_failed` when one of them errored, as "no handle" is then not a final answer.
+    """
+    github_username = None
+    artifacts["github_lookup_failed"] = False
+    if RESUME_EXTRACTION_MODE != "unified":
+        with stage("url_find"):
+            try:
+                github_url = await asyncio.to_thread(find_github_url_with_llm, resume_text)
+            except Exception as e:
+                print(f"Error invoking LLM for URL extraction: {e}")
+                github_url = None
+                artifacts["github_lookup_failed"] = True
+        if github_url:
+            github_username = github_url.split('/')[-1]
+            artifacts["github_source"] = _confirmed_source(github_username, label, "llm_url")
+            print(f"Found GitHub URL for {candidate_name}: {github_url}")
+
+    if not github_username:
+        # 4. Fallback: Search for GitHub profile by name
+        print(f"No GitHub URL found. Attempting to search for a profile for {candidate_name}.")
+        with stage("name_search"):
+            try:
+                profile_url = await find_github_profile_by_name(candidate_name, artifacts["parsed_resume_data"].get('email'))
+            except httpx.HTTPError as e:
+                print(f"Error during GitHub profile search: {e}")
+                profile_url = None
+                artifacts["github_lookup_failed"] = True
+        if profile_url:
+            github_username = profile_url.split('/')[-1]
+            artifacts["github_source"] = "name_search"
+            print(f"Fallback found profile for {candidate_name}: {profile_url}")
+    _set_github_username(artifacts, github_username)
+
+
+async def _retry_github_lookup(filename: str, cached: dict) -> dict:
+    """Runs the GitHub lookup of a cached resume again, after it failed when the resume was first seen."""
+    artifacts = dict(cached)
+    resume_text = artifacts["raw_resume_text"]
+    handle = find_github_handle(resume_text, [])
+    label = handle if handle is not None and handle["source"] not in TRUSTED_SOURCES else None
+    candidate_name = artifacts["parsed_resume_data"].get('name') or os.path.splitext(filename)[0]
+    await _lookup_github_username(resume_text, candidate_name, label, artifacts)
+    return artifacts
+
+
+async def screen_resume(
+    filename: str,
+    pdf_bytes: bytes,
+    job_description: str,
+    job_description_id: str,
+    extracted: dict | None = None,
+    ranking: dict | None = None,
+) -> dict | None:
+    """
+    Runs the full screening pipeline for a single resume.
+    PDF parsing runs in worker processes and LLM calls in worker threads, so the event loop stays free.
+    Returns the candidate data, or None if the candidate could not be screened.
+    """
+    candidate_data = await prepare_candidate(filename, pdf_bytes, job_description, job_description_id, extracted, ranking)
+    if candidate_data is None:
+        return None
+
+    # 6. Evaluate the candidate using the evaluator agent
+    with stage("evaluate"):
+        evaluation = await asyncio.to_thread(
+            evaluate_candidate,
+            job_description=job_description,
+            resume_data=candidate_data["parsed_resume_data"],
+            github_data=candidate_data["github_data"],
+            report=candidate_data["evaluation_context"]
+        )
+
+    candidate_data["final_evaluation"] = evaluation
+    await asyncio.to_thread(save_candidate, candidate_data, job_description_id)
+    return candidate_data
+
+
+async def prepare_candidate(
+    filename: str,
+    pdf_bytes: bytes,
+    job_description: str,
+    job_description_id: str,
+    extracted: dict | None = None,
+    ranking: dict | None = None,
+) -> dict | None:
+    """
+    Everything before the evaluation: resume text, parsed resume data, GitHub username and GitHub data.
+    Returns the candidate data without final_evaluation, or None if the resume has no text.
+    `ranking` is the candidate's pre-rank entry when the pre-ranking stage ran.
+    """
+    print(f"Processing resume: {filename}")
+    # Stage timings, LLM tokens and GitHub requests of this candidate are collected from here on
+    metrics = start_candidate_metrics()
+    if extracted is not None and extracted["pdf_content"] is not None:
+        # Extracted ahead by the pre-ranking stage
+        add_stage_time(metrics["timings"], "pdf_extraction", extracted["pdf_content"]["elapsed_ms"] / 1000)
+    artifacts = await resolve_resume(filename, pdf_bytes, extracted)
+    resume_text = artifacts["raw_resume_text"]
+    candidate_data = _new_candidate_data(filename, job_description, artifacts, ranking)
+    candidate_data["timings"] = metrics["timings"]
+    candidate_data["usage"] = metrics["usage"]
+
+    if not resume_text:
+        print(f"Warning: Could not extract text from {filename}. Skipping this candidate.")
+        return None
+
+    # Copy, so the cached artifacts are never modified
+    parsed_resume_data = dict(artifacts["parsed_resume_data"])
+    candidate_data["parsed_resume_data"] = parsed_resume_data
+
+    if not parsed_resume_data.get('name'):
+        parsed_resume_data['name'] = os.path.splitext(filename)[0]
+        print(f"Warning: Could not extract a name. Using filename as name: {parsed_resume_data['name']}")
+
+    # 5. Get GitHub data
+    github_data = {}
+    github_username = artifacts["github_username"]
+    if github_username:
+        with stage("github_fetch"):
+            github_data = await get_github_data(github_username, job_description)
+
+    candidate_data["github_data"] = github_data
+    return candidate_data
+
+
+def _new_candidate_data(filename: str, job_description: str, artifacts: dict, ranking: dict | None) -> dict:
+    # Data dictionary to store all intermediate steps
+    return {
+        "candidate_id": str(uuid.uuid4()),
+        "job_description": job_description,
+        "filename": filename,
+        "pdf_sha256": artifacts["pdf_sha256"],
+        "resume_cache_hit": artifacts["cache_hit"],
+        "pdf_extraction": artifacts["pdf_extraction"],
+        "github_username": artifacts["github_username"],
+        "github_source": artifacts["github_source"],
+        "github_confidence": artifacts["github_confidence"],
+        "raw_resume_text": artifacts["raw_resume_text"],
+        "prerank": ranking,
+        "parsed_resume_data": {},
+        "github_data": {},
+        "evaluation_context": {},
+        "final_evaluation": {}
+    }
+
+
+def save_candidate(candidate_data: dict, job_description_id: str):
+    # 7. Store all data for this candidate in the candidate store
+    get_candidate_store().save_candidate(candidate_data, job_description_id)
+
+
+def start_job(job_description: str) -> str:
+    """
+    Registers a new screening job in the candidate store and creates its output folder.
+    Blocking (SQLite and file system); async callers run it with asyncio.to_thread.
+    """
+    job_description_id = str(uuid.uuid4())
+    os.makedirs(f"data_output/{job_description_id}", exist_ok=True)
+    get_candidate_store().save_job(job_description_id, job_description)
+    return job_description_id
+
+
+async def iter_screen_resumes(
+    resumes: Iterable[tuple[str, bytes]] | AsyncIterable[tuple[str, bytes]],
+    job_description: str,
+    job_description_id: str,
+    concurrency: int = SCREEN_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+):
+    """
+    Screens all resumes, given as (filename, PDF bytes) pairs, concurrently with at most
+    `concurrency` candidates in flight, and yields (upload index, candidate data) as soon as
+    each candidate finishes. The candidate data is None for a candidate that could not be
+    screened; its failure does not affect the others.
+    `resumes` can also be a lazy iterator (e.g. a ResumeArchive, read in a worker thread) or an
+    async iterable; it is only read ahead by a few resumes, so only those are held in memory.
+    A shared `semaphore` can be passed to bound the work of several batches together.
+    With PRERANK_TOP_K / PRERANK_MIN_SCORE set, all texts are extracted and pre-ranked first;
+    candidates outside the shortlist are recorded with their pre-rank score and yielded right away.
+    """
+    # aclosing: closing this generator early also stops the work of the inner one right away
+    async with contextlib.aclosing(_iter_screen_resumes(resumes, job_description, job_description_id, concurrency, semaphore)) as results:
+        async for index, candidate_data in results:
+            if candidate_data is None:
+                CANDIDATES.inc(outcome="failed")
+            elif candidate_data.get("prerank") and not candidate_data["prerank"]["shortlisted"]:
+                CANDIDATES.inc(outcome="skipped")
+            else:
+                CANDIDATES.inc(outcome="screened")
+            yield index, candidate_data
+
+
+async def _iter_screen_resumes(
+    resumes: Iterable[tuple[str, bytes]] | AsyncIterable[tuple[str, bytes]],
+    job_description: str,
+    job_description_id: str,
+    concurrency: int,
+    semaphore: asyncio.Semaphore | None,
+):
+    semaphore = semaphore or asyncio.Semaphore(max(1, concurrency))
+    # Resumes read from the input but not finished yet
+    window = READ_AHEAD_FACTOR * max(1, concurrency)
+    # (upload index, filename, PDF bytes, extract_resume result, pre-rank entry)
+    items = _work_items(resumes)
+    if prerank_enabled():
+        finished, items = await _prerank_stage(items, job_description, job_description_id, semaphore, window)
+        for item in finished:
+            yield item
+
+    if EVALUATION_MODE == "batched":
+        async for item in _iter_screen_batched(items, job_description, job_description_id, semaphore, window):
+            yield item
+        return
+
+    async def run(index: int, filename: str, pdf_bytes: bytes, extracted: dict | None, ranking: dict | None) -> tuple[int, dict | None]:
+        async with semaphore:
+            try:
+                return index, await screen_resume(filename, pdf_bytes, job_description, job_description_id, extracted, ranking)
+            except Exception as e:
+                print(f"Error screening {filename}: {e}")
+                return index, None
+
+    async with contextlib.aclosing(_run_windowed(items, run, window)) as results:
+        async for item in results:
+            yield item
+
+
+async def _work_items(resumes):
+    """
+    Work items (upload index, filename, PDF bytes, None, None) from a list, an async iterable
+    or a blocking iterator, which is advanced in a worker thread so reading never blocks the event loop.
+    """
+    if hasattr(resumes, "__aiter__"):
+        index = 0
+        async for filename, pdf_bytes in resumes:
+            yield index, filename, pdf_bytes, None, None
+            index += 1
+    elif isinstance(resumes, (list, tuple)):
+        for index, (filename, pdf_bytes) in enumerate(resumes):
+            yield index, filename, pdf_bytes, None, None
+    else:
+        iterator = iter(resumes)
+        index = 0
+        while (resume := await asyncio.to_thread(next, iterator, None)) is not None:
+            yield index, resume[0], resume[1], None, None
+            index += 1
+
+
+async def _as_items(items):
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _next_item(items):
+    return await anext(items, None)
+
+
+async def _run_windowed(items, work, window: int):
+    """
+    Runs `work(*item)` for every work item and yields the results as they finish. The next item
+    is only read while fewer than `window` are unfinished, so a lazy input is consumed at the pace of the work.
+    """
+    items = _as_items(items)
+    running = set()
+    reader = None
+    exhausted = False
+    try:
+        while True:
+            if reader is None and not exhausted and len(running) < window:
+                reader = asyncio.create_task(_next_item(items))
+            waiting = running | ({reader} if reader else set())
+            if not waiting:
+                return
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is reader:
+                    reader = None
+                    item = task.result()
+                    if item is None:
+                        exhausted = True
+                    else:
+                        running.add(asyncio.create_task(work(*item)))
+                else:
+                    running.discard(task)
+                    yield task.result()
+    finally:
+        # Stop the remaining work if the consumer goes away (e.g. a streaming client disconnects)
+        for task in running | ({reader} if reader else set()):
+            task.cancel()
+
+
+async def _prerank_stage(
+    items,
+    job_description: str,
+    job_description_id: str,
+    semaphore: asyncio.Semaphore,
+    window: int,
+) -> tuple[list[tuple[int, dict | None]], list[tuple]]:
+    """
+    Extracts the text of every resume and scores all of them against the job description with BM25.
+    Returns the finished (upload index, candidate data) pairs of the candidates that are not shortlisted,
+    and the work items of the shortlisted ones.
+    """
+    async def extract(index: int, filename: str, pdf_bytes: bytes, *_) -> tuple[int, str, dict | None]:
+        async with semaphore:
+            try:
+                return index, filename, await extract_resume(filename, pdf_bytes)
+            except Exception as e:
+                print(f"Error extracting {filename}: {e}")
+                return index, filename, None
+
+    # Only the extracted text is kept: the PDFs are not needed once extracted
+    filenames, extracted = {}, {}
+    async for index, filename, result in _run_windowed(items, extract, window):
+        filenames[index] = filename
+        extracted[index] = result
+    order = sorted(extracted)
+    ranking = prerank(job_description, [(extracted[index] or {}).get("text") or "" for index in order])
+
+    # Work items in ranking order, so the best pre-rank scores start first
+    finished, shortlisted = [], []
+    for entry in ranking:
+        index = order[entry["index"]]
+        entry = {**entry, "index": index}
+        filename = filenames[index]
+        if not (extracted[index] or {}).get("text"):
+            print(f"Warning: Could not extract text from {filename}. Skipping this candidate.")
+            finished.append((index, None))
+        elif entry["shortlisted"]:
+            shortlisted.append((index, filename, None, extracted[index], entry))
+        else:
+            finished.append((index, await _record_skipped(filename, job_description, job_description_id, extracted[index], entry)))
+    print(f"Pre-ranking shortlisted {len(shortlisted)} of {len(order)} resumes.")
+    return finished, shortlisted
+
+
+async def _record_skipped(filename: str, job_description: str, job_description_id: str, extracted: dict, ranking: dict) -> dict:
+    """Stores a candidate that did not make the pre-rank shortlist, without GitHub data or evaluation."""
+    artifacts = extracted["cached"] or {
+        "raw_resume_text": extracted["text"],
+        "parsed_resume_data": {},
+        "github_username": None,
+        "github_source": None,
+        "github_confidence": None,
+    }
+    artifacts = {
+        **artifacts,
+        "pdf_sha256": extracted["pdf_sha256"],
+        "cache_hit": extracted["cached"] is not None,
+        "pdf_extraction": _extraction_info(extracted["pdf_content"]) if extracted["pdf_content"] else None,
+    }
+    candidate_data = _new_candidate_data(filename, job_description, artifacts, ranking)
+    candidate_data["parsed_resume_data"] = dict(artifacts["parsed_resume_data"])
+    await asyncio.to_thread(save_candidate, candidate_data, job_description_id)
+    return candidate_data
+
+
+async def _iter_screen_batched(
+    items: list[tuple],
+    job_description: str,
+    job_description_id: str,
+    semaphore: asyncio.Semaphore,
+    window: int,
+):
+    """
+    Batched evaluation mode: candidates are prepared concurrently, and every EVALUATION_BATCH_MAX
+    prepared candidates (or the rest, once no preparation is left) are evaluated in one call.
+    """
+    async def prepare(index: int, filename: str, pdf_bytes: bytes, extracted: dict | None, ranking: dict | None) -> tuple[int, dict | None]:
+        async with semaphore:
+            try:
+                return index, await prepare_candidate(filename, pdf_bytes, job_description, job_description_id, extracted, ranking)
+            except Exception as e:
+                print(f"Error screening {filename}: {e}")
+                return index, None
+
+    async def evaluate(batch: list[tuple[int, dict]]) -> list[tuple[int, dict | None]]:
+        start = time.perf_counter()
+        try:
+            with stage("evaluate"):
+                evaluations = await asyncio.to_thread(
+                    evaluate_candidates_batch,
+                    job_description,
+                    [
+                        {
+                            "candidate_id": candidate_data["candidate_id"],
+                            "resume_data": candidate_data["parsed_resume_data"],
+                            "github_data": candidate_data["github_data"],
+                        }
+                        for _, candidate_data in batch
+                    ],
+                    {candidate_data["candidate_id"]: candidate_data["evaluation_context"] for _, candidate_data in batch},
+                )
+        except Exception as e:
+            print(f"Error evaluating a batch of {len(batch)} candidates: {e}")
+            return [(index, None) for index, _ in batch]
+
+        elapsed = time.perf_counter() - start
+        finished = []
+        for index, candidate_data in batch:
+            # Every candidate of the batch waited for the whole call
+            add_stage_time(candidate_data["timings"], "evaluate", elapsed)
+            candidate_data["final_evaluation"] = evaluations.get(candidate_data["candidate_id"], {})
+            await asyncio.to_thread(save_candidate, candidate_data, job_description_id)
+            finished.append((index, candidate_data))
+        return finished
+
+    # A full batch must fit into the read-ahead window
+    window = max(window, EVALUATION_BATCH_MAX)
+    items = _as_items(items)
+    reader = None
+    exhausted = False
+    preparing = set()
+    evaluating = set()
+    prepared = []
+    try:
+        while not exhausted or reader or preparing or evaluating or prepared:
+            # Read the next resume while fewer than `window` are being prepared or wait for their batch
+            if reader is None and not exhausted and len(preparing) + len(prepared) < window:
+                reader = asyncio.create_task(_next_item(items))
+            if prepared and (len(prepared) >= EVALUATION_BATCH_MAX or (exhausted and not preparing)):
+                batch, prepared = prepared[:EVALUATION_BATCH_MAX], prepared[EVALUATION_BATCH_MAX:]
+                evaluating.add(asyncio.create_task(evaluate(batch)))
+                continue
+
+            waiting = preparing | evaluating | ({reader} if reader else set())
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is reader:
+                    reader = None
+                    item = task.result()
+                    if item is None:
+                        exhausted = True
+                    else:
+                        preparing.add(asyncio.create_task(prepare(*item)))
+                elif task in preparing:
+                    preparing.discard(task)
+                    index, candidate_data = task.result()
+                    if candidate_data is None:
+                        yield index, None
+                    else:
+                        prepared.append((index, candidate_data))
+                else:
+                    evaluating.discard(task)
+                    for item in task.result():
+                        yield item
+    finally:
+        for task in preparing | evaluating | ({reader} if reader else set()):
+            task.cancel()
+
+
+async def screen_resumes(
+    resumes: Iterable[tuple[str, bytes]] | AsyncIterable[tuple[str, bytes]],
+    job_description: str,
+    job_description_id: str,
+    concurrency: int = SCREEN_CONCURRENCY,
+) -> list[dict]:
+    """Screens all resumes concurrently and returns the screened candidates in upload order."""
+    results = {}
+    async for index, candidate_data in iter_screen_resumes(resumes, job_description, job_description_id, concurrency):
+        results[index] = candidate_data
+    return [results[index] for index in sorted(results) if results[index]]
@@ -0,0 +1,228 @@
+# app/services/skills.py
+# Skill normalization and candidate x skill coverage, without any LLM calls.
+import re
+
+# Canonical skill id -> aliases (the id itself always matches too).
+SKILL_ALIASES = {
+    "python": ["py", "python3", "python 3", "python2", "cpython"],
+    "java": ["java 8", "java 11", "java 17", "core java"],
+    "javascript": ["js", "ecmascript", "es6", "vanilla js"],
+    "typescript": ["ts"],
+    "c": ["c language", "ansi c"],
+    "c++": ["cpp", "c plus plus"],
+    "c#": ["csharp", "c sharp"],
+    "go": ["golang"],
+    "rust": ["rust lang", "rustlang"],
+    "kotlin": [],
+    "swift": [],
+    "r": ["r language", "rstats"],
+    "sql": ["structured query language", "t-sql", "pl/sql"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "react": ["reactjs", "react.js", "react js"],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vuejs", "vue.js"],
+    "node.js": ["node", "nodejs", "node js"],
+    "express": ["expressjs", "express.js"],
+    "django": [],
+    "flask": [],
+    "fastapi": ["fast api"],
+    "spring": ["spring boot", "springboot"],
+    "machine learning": ["ml"],
+    "deep learning": ["dl"],
+    "nlp": ["natural language processing"],
+    "computer vision": ["opencv"],
+    "llm": ["llms", "large language models", "large language model"],
+    "langchain": [],
+    "pytorch": ["torch"],
+    "tensorflow": ["tf", "tensorflow 2"],
+    "keras": [],
+    "scikit-learn": ["sklearn", "scikit learn", "scikit"],
+    "pandas": [],
+    "numpy": [],
+    "data analysis": ["data analytics"],
+    "postgresql": ["postgres", "psql"],
+    "mysql": [],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "docker": ["containers", "containerization"],
+    "kubernetes": ["k8s"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "git": ["github", "gitlab", "version control"],
+    "linux": ["unix", "bash", "shell scripting"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "github actions", "jenkins"],
+    "rest api": ["rest", "restful", "rest apis", "restful apis", "api development"],
+    "graphql": [],
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./\-]*[a-z0-9+#]|[a-z0-9]")
+# Phrases in a job description that are never skills on their own.
+_AMBIGUOUS_IN_TEXT = {"c", "r", "go", "rest", "ts", "tf", "dl", "ml", "py", "node", "torch", "scikit", "containers", "unix"}
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+
+def normalize_text(skill: str) -> str:
+    """Lowercased, single-spaced form of a skill name, e.g. ' React.JS ' -> 'react.js'."""
+    return " ".join(_tokens(skill))
+
+
+class SkillIndex:
+    """
+    Maps skill spellings onto canonical ids: a hash lookup for whole skill names and a
+    token trie for finding (multi-word) skills inside free text such as job descriptions.
+    """
+    def __init__(self, aliases: dict[str, list[str]]):
+        self._lookup = {}
+        self._trie = {}
+        for skill_id, names in aliases.items():
+            for name in [skill_id, *names]:
+                key = normalize_text(name)
+                self._lookup[key] = skill_id
+                if key not in _AMBIGUOUS_IN_TEXT:
+                    self._insert(key.split(), skill_id)
+
+    def _insert(self, tokens: list[str], skill_id: str):
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[None] = skill_id
+
+    def normalize(self, skill: str) -> str | None:
+        """Canonical id of a skill name. Unknown skills keep their normalized spelling as id."""
+        skill_ids = self.normalize_all(skill)
+        return skill_ids[0] if len(skill_ids) == 1 else normalize_text(skill) or None
+
+    def normalize_all(self, skill: str) -> list[str]:
+        """
+        Canonical ids of a skill entry that may name several skills or decorate one,
+        e.g. "Python (Advanced)" -> ["python"], "Docker & Kubernetes" -> ["docker", "kubernetes"].
+        """
+        key = normalize_text(skill)
+        if not key:
+            return []
+        if key in self._lookup:
+            return [self._lookup[key]]
+        return self.find(key) or [key]
+
+    def find(self, text: str) -> list[str]:
+        """Canonical ids of the known skills mentioned in a text, in order of first mention."""
+        tokens = _tokens(text)
+        found = []
+        position = 0
+        while position < len(tokens):
+            node, match, length = self._trie, None, 0
+            for offset in range(position, len(tokens)):
+                node = node.get(tokens[offset])
+                if node is None:
+                    break
+                if None in node:
+                    match, length = node[None], offset - position + 1
+            if match is not None:
+                if match not in found:
+                    found.append(match)
+                position += length
+            else:
+                position += 1
+        return found
+
+
+_index: SkillIndex | None = None
+
+
+def get_skill_index() -> SkillIndex:
+    global _index
+    if _index is None:
+        _index = SkillIndex(SKILL_ALIASES)
+    return _index
+
+
+def required_skills(job_description: str) -> list[str]:
+    """The known skills a job description asks for."""
+    return get_skill_index().find(job_description)
+
+
+def candidate_skills(candidate_data: dict) -> set[str]:
+    """Canonical skills of a stored candidate: the parsed resume skills plus the languages of their GitHub projects."""
+    index = get_skill_index()
+    parsed = candidate_data.get("parsed_resume_data") or {}
+    names = []
+    for skill in parsed.get("skills") or []:
+        if isinstance(skill, str):
+            # Some resumes list "Python, SQL, Docker" as one entry
+            names.extend(re.split(r"[,;|•]", skill))
+    for project in (candidate_data.get("github_data") or {}).get("projects") or []:
+        if project.get("language"):
+            names.append(project["language"])
+    return {skill_id for name in names for skill_id in index.normalize_all(name)}
+
+
+def _evaluation_score(candidate: dict) -> float:
+    score = (candidate.get("final_evaluation") or {}).get("score")
+    return score if isinstance(score, (int, float)) else -1
+
+
+def skill_matrix(
+    job_description: str,
+    candidates: list[dict],
+    skills: list[str] | None = None,
+    require: list[str] | None = None,
+    min_coverage: float = 0.0,
+) -> dict:
+    """
+    Builds the candidates x required-skills coverage matrix of a job in one go.
+    `skills` overrides the skills taken from the job description; candidates missing any of the
+    `require` skills or below `min_coverage` are filtered out. Candidates are sorted by coverage,
+    then by evaluation score, and each row lists the matched and missing skills.
+    """
+    # numpy is imported on first use, so that it does not slow down the start of the app
+    import numpy as np
+
+    index = get_skill_index()
+    if skills:
+        columns = list(dict.fromkeys(index.normalize(skill) for skill in skills if normalize_text(skill)))
+    else:
+        columns = required_skills(job_description)
+    column = {skill_id: position for position, skill_id in enumerate(columns)}
+
+    matrix = np.zeros((len(candidates), len(columns)), dtype=bool)
+    for row, candidate in enumerate(candidates):
+        for skill_id in candidate_skills(candidate):
+            if skill_id in column:
+                matrix[row, column[skill_id]] = True
+
+    coverage = matrix.mean(axis=1) if columns else np.zeros(len(candidates))
+    scores = np.array([_evaluation_score(candidate) for candidate in candidates], dtype=float)
+
+    keep = coverage >= min_coverage
+    required_columns = [column[skill_id] for skill_id in (index.normalize(skill) for skill in require or []) if skill_id in column]
+    if required_columns:
+        keep &= matrix[:, required_columns].all(axis=1)
+
+    rows = np.flatnonzero(keep)
+    rows = rows[np.lexsort((-scores[rows], -coverage[rows]))]
+
+    skills_array = np.array(columns, dtype=object)
+    return {
+        "skills": columns,
+        "total_candidates": len(candidates),
+        # Share of the listed candidates that have each skill
+        "skill_coverage": dict(zip(columns, np.round(matrix[rows].mean(axis=0), 4).tolist())) if len(rows) else dict.fromkeys(columns, 0.0),
+        "candidates": [
+            {
+                "candidate_id": candidates[row].get("candidate_id"),
+                "name": (candidates[row].get("final_evaluation") or {}).get("candidate_name")
+                        or (candidates[row].get("parsed_resume_data") or {}).get("name"),
+                "score": (candidates[row].get("final_evaluation") or {}).get("score"),
+                "coverage": round(float(coverage[row]), 4),
+                "matched": skills_array[matrix[row]].tolist(),
+                "missing": skills_array[~matrix[row]].tolist(),
+                "row": matrix[row].astype(int).tolist(),
+            }
+            for row in rows
+        ],
+    }
@@ -0,0 +1,145 @@
+# app/services/sqlite_cache.py
+import os
+import json
+import sqlite3
+import threading
+import time
+
+# Root directory for all on-disk caches.
+CACHE_DIR = os.getenv("SMARTSCAN_CACHE_DIR", ".cache")
+# Access times of cache hits are written in batches: after this many hits, after this many
+# seconds, or with the next write, instead of one UPDATE and commit per hit.
+TOUCH_BATCH_SIZE = 256
+TOUCH_BATCH_SECONDS = 5.0
+
+
+class SQLiteCache:
+    """
+    Size-bounded key/value store kept in a single SQLite file.
+    When the stored values grow past `max_bytes`, the least recently used entries are evicted.
+    Entries can carry an optional time-to-live. Safe to share between threads and processes.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        # key -> last access of hits not yet written to the file
+        self._touches = {}
+        self._touched_at = time.time()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the stored value, or None if the key is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete(key)
+                self._conn.commit()
+                self.stats["misses"] += 1
+                return None
+            self._touches[key] = now
+            if len(self._touches) >= TOUCH_BATCH_SIZE or now - self._touched_at >= TOUCH_BATCH_SECONDS:
+                self._flush_touches()
+                self._conn.commit()
+            self.stats["hits"] += 1
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None):
+        """Stores a value, optionally expiring after `ttl` seconds."""
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._flush_touches()
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), size, expires_at, now),
+            )
+            self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._delete(key)
+            self._conn.commit()
+
+    def get_json(self, key: str):
+        value = self.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, key: str, value, ttl: float | None = None):
+        self.set(key, json.dumps(value, separators=(",", ":")).encode("utf-8"), ttl=ttl)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._touches.clear()
+            self._total_bytes = 0
+
+    def info(self) -> dict:
+        """Returns the usage counters together with the current size of the store."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {**self.stats, "entries": entries, "bytes": self._total_bytes, "max_bytes": self.max_bytes}
+
+    def _flush_touches(self):
+        """Writes the pending access times (the caller holds the lock and commits)."""
+        if self._touches:
+            self._conn.executemany(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                [(last_access, key) for key, last_access in self._touches.items()],
+            )
+            self._touches.clear()
+        self._touched_at = time.time()
+
+    def _delete(self, key: str):
+        row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self):
+        # Other processes may share the file, so recount before evicting.
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        # Drop least recently used entries until the store is back under 90% of its budget.
+        target = int(self.max_bytes * 0.9)
+        while self._total_bytes > target:
+            rows = self._conn.execute("SELECT key, size FROM entries ORDER BY last_access LIMIT 64").fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.stats["evictions"] += 1
+                if self._total_bytes <= target:
+                    break
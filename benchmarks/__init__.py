@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+# Offline benchmarks: a fake OpenAI-compatible chat API, a fake GitHub API and synthetic
+# resume PDFs, so pipeline throughput can be measured without OpenAI credits or GitHub quota.
+#
+#   python -m benchmarks.run --batch-sizes 1,8,32 --concurrency 1,8 --output baseline.json
@@ -0,0 +1,220 @@
+# benchmarks/fake_github.py
+# A local stand-in for the GitHub REST and GraphQL APIs with configurable repo counts,
+# README sizes, latency and per-token rate limits (including the X-RateLimit-* headers).
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+_TOPICS = ["python", "machine-learning", "nlp", "react", "docker", "api", "cli", "data", "web", "pytorch"]
+_LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Java", "C++", "Jupyter Notebook"]
+
+
+class FakeGitHub:
+    """
+    Serves the endpoints the scraper uses (/users/{u}, /users/{u}/repos, /repos/{u}/{r}/readme,
+    /repos/{u}/{r}/commits, /search/users and POST /graphql) on 127.0.0.1.
+    Each token (the Authorization header) gets `rate_limit` requests per `rate_window` seconds;
+    responses carry ETags and answer If-None-Match with 304.
+    Logins in `missing_users` do not exist; GraphQL queries for a login in `graphql_errors`
+    answer with that error message.
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        repos: int = 30,
+        readme_bytes: int = 4000,
+        commits: int = 5,
+        latency: float = 0.0,
+        rate_limit: int = 5000,
+        rate_window: float = 3600,
+    ):
+        self.repos = repos
+        self.readme_bytes = readme_bytes
+        self.commits = commits
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        # Dates are relative to the server start, so a repo's pushed_at (and ETag) is stable across requests
+        self._epoch = time.time()
+        self.requests = 0
+        self.not_modified = 0
+        self.rate_limited = 0
+        self.missing_users = set()
+        self.graphql_errors = {}  # login -> error message
+        self._quota = {}  # token -> [remaining, reset_at]
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self.base_url = f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "FakeGitHub":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    # --- data ---
+
+    def _repo(self, username: str, index: int) -> dict:
+        rng = random.Random(f"{username}/{index}")
+        return {
+            "name": f"project-{index}",
+            "full_name": f"{username}/project-{index}",
+            "owner": {"login": username},
+            "description": f"A {rng.choice(_TOPICS)} project written in {rng.choice(_LANGUAGES)}",
+            "language": rng.choice(_LANGUAGES),
+            "stargazers_count": int(rng.paretovariate(1.2)) - 1,
+            "fork": rng.random() < 0.15,
+            "topics": rng.sample(_TOPICS, 2),
+            "pushed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._epoch - rng.randint(0, 3 * 365) * 86400)),
+        }
+
+    def _readme(self, repo_name: str) -> str:
+        line = f"# {repo_name}\n![build](https://img.shields.io/badge/build-passing-green)\nUsage: run the service and call the API.\n"
+        return (line * (self.readme_bytes // len(line) + 1))[: self.readme_bytes]
+
+    def _route(self, method: str, path: str, query: dict, body: bytes) -> tuple[int, object, dict]:
+        parts = [part for part in path.split("/") if part]
+        if method == "POST" and parts == ["graphql"]:
+            return 200, self._graphql(json.loads(body or b"{}")), {}
+        if parts[:2] == ["search", "users"]:
+            name = (query.get("q") or [""])[0]
+            login = "-".join(word for word in name.lower().split() if ":" not in word) or "nobody"
+            return 200, {"total_count": 1, "items": [{"login": login, "html_url": f"https://github.com/{login}"}]}, {}
+        if len(parts) >= 2 and parts[0] == "users" and parts[1] in self.missing_users:
+            return 404, {"message": "Not Found"}, {}
+        if len(parts) == 2 and parts[0] == "users":
+            return 200, {"login": parts[1], "public_repos": self.repos, "followers": 42}, {}
+        if len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+            per_page = min(int((query.get("per_page") or ["30"])[0]), 100)
+            page = int((query.get("page") or ["1"])[0])
+            start = (page - 1) * per_page
+            repos = [self._repo(parts[1], index) for index in range(start, min(start + per_page, self.repos))]
+            headers = {}
+            if start + per_page < self.repos:
+                headers["Link"] = f'<{self.base_url}/users/{parts[1]}/repos?per_page={per_page}&page={page + 1}>; rel="next"'
+            return 200, repos, headers
+        if len(parts) == 4 and parts[0] == "repos" and parts[3] == "readme":
+            content = base64.b64encode(self._readme(parts[2]).encode()).decode()
+            return 200, {"name": "README.md", "encoding": "base64", "content": content}, {}
+        if len(parts) == 4 and parts[0] == "repos" and parts[3] == "commits":
+            count = min(int((query.get("per_page") or [str(self.commits)])[0]), self.commits)
+            commits = [
+                {"sha": hashlib.sha1(f"{parts[2]}{n}".encode()).hexdigest(), "commit": {"message": f"Improve {parts[2]} ({n})\n\nDetails."}}
+                for n in range(count)
+            ]
+            return 200, commits, {}
+        return 404, {"message": "Not Found"}, {}
+
+    def _graphql(self, request: dict) -> dict:
+        variables = request.get("variables") or {}
+        login = variables.get("login", "user")
+        if login in self.graphql_errors:
+            return {"data": None, "errors": [{"message": self.graphql_errors[login]}]}
+        if login in self.missing_users:
+            return {"data": {"user": None}}
+        size = int(variables.get("pageSize") or 25)
+        start = int(variables.get("cursor") or 0)
+        nodes = []
+        for index in range(start, min(start + size, self.repos)):
+            repo = self._repo(login, index)
+            nodes.append({
+                "name": repo["name"],
+                "description": repo["description"],
+                "stargazerCount": repo["stargazers_count"],
+                "isFork": repo["fork"],
+                "isArchived": False,
+                "repositoryTopics": {"nodes": [{"topic": {"name": topic}} for topic in repo["topics"]]},
+                "pushedAt": repo["pushed_at"],
+                "primaryLanguage": {"name": repo["language"]},
+                "readme": {"text": self._readme(repo["name"])},
+                "readmeLower": None,
+                "defaultBranchRef": {"target": {"history": {"nodes": [
+                    {"oid": hashlib.sha1(f"{repo['name']}{n}".encode()).hexdigest(), "message": f"Improve {repo['name']} ({n})"}
+                    for n in range(min(3, self.commits))
+                ]}}},
+            })
+        end = start + len(nodes)
+        return {"data": {"user": {
+            "login": login,
+            "followers": {"totalCount": 42},
+            "repositories": {
+                "totalCount": self.repos,
+                "pageInfo": {"hasNextPage": end < self.repos, "endCursor": str(end)},
+                "nodes": nodes,
+            },
+        }}}
+
+    # --- HTTP ---
+
+    def _take_quota(self, token: str) -> tuple[int, float]:
+        now = time.time()
+        with self._lock:
+            self.requests += 1
+            remaining, reset_at = self._quota.get(token, (self.rate_limit, now + self.rate_window))
+            if reset_at <= now:
+                remaining, reset_at = self.rate_limit, now + self.rate_window
+            if remaining > 0:
+                remaining -= 1
+                self._quota[token] = (remaining, reset_at)
+                return remaining, reset_at
+            self.rate_limited += 1
+            return -1, reset_at
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        body = handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlsplit(handler.path)
+        token = handler.headers.get("Authorization") or "anonymous"
+        remaining, reset_at = self._take_quota(token)
+        headers = {
+            "Content-Type": "application/json",
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-RateLimit-Reset": str(int(reset_at)),
+            "X-RateLimit-Resource": "graphql" if url.path == "/graphql" else "search" if url.path.startswith("/search") else "core",
+        }
+        if remaining < 0:
+            status, payload = 403, {"message": "API rate limit exceeded"}
+        else:
+            status, payload, extra = self._route(method, url.path, parse_qs(url.query), body)
+            headers.update(extra)
+
+        data = json.dumps(payload).encode()
+        if status == 200 and method == "GET":
+            etag = '"' + hashlib.md5(data).hexdigest() + '"'
+            headers["ETag"] = etag
+            if handler.headers.get("If-None-Match") == etag:
+                with self._lock:
+                    self.not_modified += 1
+                status, data = 304, b""
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
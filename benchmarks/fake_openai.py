@@ -0,0 +1,100 @@
+# benchmarks/fake_openai.py
+# A stub of the OpenAI chat completions API with configurable latency and canned JSON answers
+# for the resume parser, the GitHub URL finder and the (single and batched) evaluator.
+import json
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+def canned_answer(prompt: str) -> str:
+    """Picks an answer in the format the prompt asks for."""
+    if "expert resume parser" in prompt:
+        name = re.search(r"Resume Text:\s*---\s*\n\s*(.+)", prompt)
+        username = re.search(r"Resume Text:[\s\S]*?github\.com/([A-Za-z0-9-]+)", prompt)
+        return json.dumps({
+            "name": name.group(1).strip() if name else "Bench Candidate",
+            "email": "bench@example.com",
+            "phone": None,
+            "github_url": f"https://github.com/{username.group(1)}" if username else None,
+            "github_username": username.group(1) if username else None,
+            "github_confidence": 0.9 if username else 0.0,
+            "skills": ["Python", "Docker", "SQL"],
+            "experience": [{"company": "Company", "title": "Software Engineer", "duration": "2021 - present"}],
+            "projects": [{"name": "Project", "description": "A service"}],
+            "education": [],
+        })
+    if "find and extract the candidate's GitHub profile URL" in prompt:
+        username = re.search(r"Resume Text:[\s\S]*?github\.com/([A-Za-z0-9-]+)", prompt)
+        return f"https://github.com/{username.group(1)}" if username else "null"
+    evaluation = {
+        "candidate_name": "Bench Candidate",
+        "score": 6,
+        "explanation": {"strengths": ["Relevant Python experience"], "weaknesses": ["Little cloud experience"]},
+    }
+    candidate_ids = re.findall(r"### candidate_id: (\S+)", prompt)
+    if candidate_ids:
+        return json.dumps({candidate_id: evaluation for candidate_id in candidate_ids})
+    return json.dumps(evaluation)
+
+
+class FakeOpenAI:
+    """
+    Serves POST /v1/chat/completions on 127.0.0.1. `latency` (seconds) is added to every call,
+    plus `latency_per_1k_tokens` for every 1000 prompt tokens (roughly estimated from the length).
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, latency_per_1k_tokens: float = 0.0):
+        self.latency = latency
+        self.latency_per_1k_tokens = latency_per_1k_tokens
+        self.calls = 0
+        self.prompt_tokens = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                prompt = "\n".join(message.get("content") or "" for message in request.get("messages", []))
+                prompt_tokens = len(prompt) // 4
+                time.sleep(server.latency + server.latency_per_1k_tokens * prompt_tokens / 1000)
+                content = canned_answer(prompt)
+                with server._lock:
+                    server.calls += 1
+                    server.prompt_tokens += prompt_tokens
+                body = json.dumps({
+                    "id": f"chatcmpl-bench-{server.calls}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "gpt-4o-mini"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": prompt_tokens + len(content) // 4,
+                    },
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self.base_url = f"http://127.0.0.1:{self.port}/v1"
+
+    def start(self) -> "FakeOpenAI":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,83 @@
+# benchmarks/graphql_check.py
+# Runs the GraphQL backend of get_github_data against the fake GitHub server and checks its
+# output: pagination over endCursor, the README / commit mapping, ranking and the project
+# shape shared with the REST backend, and the error payloads. Exits non-zero on a mismatch.
+#
+#   python -m benchmarks.graphql_check
+import asyncio
+import os
+import sys
+import tempfile
+
+from benchmarks.fake_github import FakeGitHub
+
+JOB_DESCRIPTION = "Backend intern: Python, Docker, REST APIs and data pipelines."
+
+
+async def _check(github: FakeGitHub) -> list[str]:
+    from app.services import github_graphql
+    from app.services.github_graphql import get_github_data_graphql
+    from app.services.github_client import close_github_client
+
+    failures = []
+
+    def expect(condition: bool, message: str):
+        if not condition:
+            failures.append(message)
+
+    try:
+        # Pagination: 60 repos at 25 per page are 3 queries, each continuing at the last endCursor
+        github_graphql.GITHUB_GRAPHQL_PAGE_SIZE = 25
+        before = github.requests
+        data = await get_github_data_graphql("octo-dev", JOB_DESCRIPTION)
+        expect("error" not in data, f"unexpected error: {data.get('error')}")
+        projects = data.get("projects", [])
+        expect(github.requests - before == 3, f"expected 3 GraphQL queries, got {github.requests - before}")
+        expect(data.get("public_repos") == 60, f"public_repos is {data.get('public_repos')}, expected 60")
+        names = {project["name"] for project in projects}
+        expect(names == {f"project-{index}" for index in range(60)}, f"{len(names)} distinct repos instead of all 60")
+
+        # README and commits, mapped onto the project shape of the REST backend
+        project = next((project for project in projects if project["name"] == "project-7"), {})
+        expected_keys = ["name", "description", "language", "stars", "fork", "pushed_at", "readme_content", "readme_excerpt", "recent_commits"]
+        expect(list(project) == expected_keys, f"project keys {list(project)}")
+        expect(project.get("readme_content") == github._readme("project-7"), "readme_content differs from the README blob")
+        expect((project.get("readme_excerpt") or "").startswith("# project-7 Usage:"), "readme_excerpt missing or not cleaned")
+        commits = project.get("recent_commits") or []
+        expect(len(commits) == 3, f"{len(commits)} recent commits instead of 3")
+        expect(all(len(commit["sha"]) == 7 and commit["message"].startswith("Improve project-7") for commit in commits), f"commit mapping: {commits}")
+
+        # Ranking and the project cap
+        capped = await get_github_data_graphql("octo-dev", JOB_DESCRIPTION, max_projects=5)
+        expect(len(capped.get("projects", [])) == 5, "max_projects is not applied")
+
+        # A payload with `errors`, and a login that does not exist
+        github.graphql_errors["broken-user"] = "Something went wrong while executing your query."
+        broken = await get_github_data_graphql("broken-user")
+        expect("Something went wrong" in broken.get("error", ""), f"errors payload gave {broken}")
+        github.missing_users.add("ghost-user")
+        missing = await get_github_data_graphql("ghost-user")
+        expect("not found" in missing.get("error", ""), f"missing user gave {missing}")
+    finally:
+        await close_github_client()
+    return failures
+
+
+def main():
+    github = FakeGitHub(repos=60, readme_bytes=1500).start()
+    os.environ["GITHUB_API_URL"] = github.base_url
+    os.environ.setdefault("GITHUB_TOKEN", "check")
+    os.environ["SMARTSCAN_CACHE_DIR"] = os.path.join(tempfile.mkdtemp(), ".cache")
+    os.environ["GITHUB_CACHE_ENABLED"] = "false"
+    try:
+        failures = asyncio.run(_check(github))
+    finally:
+        github.stop()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("GraphQL backend: ok" if not failures else f"GraphQL backend: {len(failures)} check(s) failed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/import_time.py
+# Cold-start time of `import app.main` (what every uvicorn worker and --reload cycle pays),
+# measured in fresh interpreters, with the slowest imports from `python -X importtime`.
+#
+#   python -m benchmarks.import_time --runs 5 --output import_time.json
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def _run(module: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    return time.perf_counter() - start, result.stderr
+
+
+def _slowest(importtime_log: str, top: int) -> list[dict]:
+    """The imports with the largest cumulative time (microseconds) from an -X importtime log."""
+    entries = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        entries.append({"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    entries.sort(key=lambda entry: entry["cumulative_ms"], reverse=True)
+    return entries[:top]
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Cold-start import time of the app.")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports listed")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    # One warm-up run, so every run finds the .pyc files already compiled
+    _run(args.module)
+    wall, log = [], ""
+    for _ in range(args.runs):
+        seconds, log = _run(args.module)
+        wall.append(seconds * 1000)
+
+    report = {
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "wall_ms": {
+            "min": round(float(np.min(wall)), 1),
+            "p50": round(float(np.median(wall)), 1),
+            "max": round(float(np.max(wall)), 1),
+        },
+        "slowest_imports": _slowest(log, args.top),
+    }
+    print(f"import {args.module}: {report['wall_ms']['p50']} ms (median of {args.runs}, including interpreter start)")
+    for entry in report["slowest_imports"]:
+        print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# benchmarks/run.py
+# Drives POST /screen and the individual agent functions against the fake OpenAI and GitHub
+# servers, and writes throughput, latency percentiles and peak memory to a JSON baseline.
+#
+#   python -m benchmarks.run --batch-sizes 1,8,32 --concurrency 1,8 --output baseline.json
+#   python -m benchmarks.run --output after.json --compare baseline.json
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.fake_github import FakeGitHub
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.synthetic_pdf import make_resume
+
+JOB_DESCRIPTION = (
+    "Machine learning intern. Python, PyTorch or TensorFlow, NLP, SQL and Docker. "
+    "Experience shipping APIs (FastAPI or Django) and working with Git on Linux is a plus."
+)
+
+
+def _configure_environment(args, openai_url: str, github_url: str, workdir: str):
+    """Points the app at the fake servers. Must run before any app module is imported."""
+    os.environ["OPENAI_API_KEY"] = "benchmark"
+    os.environ["OPENAI_BASE_URL"] = openai_url
+    os.environ["OPENAI_API_BASE"] = openai_url
+    os.environ["GITHUB_API_URL"] = github_url
+    os.environ["GITHUB_TOKEN"] = "benchmark"
+    os.environ.pop("GITHUB_TOKENS", None)
+    os.environ["SMARTSCAN_CACHE_DIR"] = os.path.join(workdir, ".cache")
+    os.environ["CANDIDATE_STORE_PATH"] = os.path.join(workdir, "candidates.sqlite")
+    if not args.with_caches:
+        # Cache hits would measure the cache, not the pipeline.
+        for name in ("LLM_CACHE_ENABLED", "GITHUB_CACHE_ENABLED", "RESUME_CACHE_ENABLED", "REPO_CACHE_ENABLED", "NAME_SEARCH_CACHE_ENABLED"):
+            os.environ[name] = "false"
+    # data_output/ is written relative to the working directory
+    os.chdir(workdir)
+
+
+def _summary(latencies: list[float], items: int, elapsed: float, peak_bytes: int) -> dict:
+    values = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "calls": len(latencies),
+        "items": items,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(items / elapsed, 3) if elapsed else None,
+        "latency_ms": {
+            "mean": round(float(values.mean()), 2),
+            "p50": round(float(p50), 2),
+            "p95": round(float(p95), 2),
+            "p99": round(float(p99), 2),
+            "max": round(float(values.max()), 2),
+        },
+        "peak_traced_mb": round(peak_bytes / 2**20, 2),
+    }
+
+
+async def _measure(calls, concurrency: int, items_per_call: int = 1) -> dict:
+    """Runs the zero-argument coroutine factories in `calls` with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed(call):
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(timed(call) for call in calls))
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return _summary(latencies, len(latencies) * items_per_call, elapsed, peak)
+
+
+async def bench_screen(args, batch_size: int, concurrency: int) -> dict:
+    import httpx
+    from app.main import app
+
+    requests = concurrency * args.rounds
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        def call_for(request_index):
+            resumes = [make_resume(request_index * batch_size + n, pages=args.pages) for n in range(batch_size)]
+
+            async def call():
+                files = [("resumes", (filename, data, "application/pdf")) for filename, data in resumes]
+                response = await client.post("/screen", data={"job_description": JOB_DESCRIPTION}, files=files)
+                response.raise_for_status()
+                if response.json().get("status") != "screening_complete":
+                    raise RuntimeError(f"/screen failed: {response.text[:200]}")
+            return call
+
+        return await _measure([call_for(n) for n in range(requests)], concurrency, items_per_call=batch_size)
+
+
+async def bench_agents(args, concurrency: int) -> dict:
+    from app.services.pdf_extractor import extract_pdf
+    from app.services.pdf_parser import find_github_url_with_llm
+    from app.services.github_scraper import get_github_data, GITHUB_MAX_PROJECTS
+    from app.services.github_graphql import get_github_data_graphql
+    from app.agents.resume_parser import parse_resume
+    from app.agents.evaluator import evaluate_candidate
+
+    count = concurrency * args.rounds
+    resumes = [make_resume(n, pages=args.pages) for n in range(count)]
+    pdfs = [data for _, data in resumes]
+    text = (await extract_pdf(pdfs[0]))["text"]
+    parsed = await asyncio.to_thread(parse_resume, text)
+    github = await get_github_data("bench-user-0")
+
+    def threaded(function, *call_args):
+        return lambda: asyncio.to_thread(function, *call_args)
+
+    scenarios = {
+        "extract_pdf": [lambda data=data: extract_pdf(data) for data in pdfs],
+        "parse_resume": [threaded(parse_resume, text, unified) for unified in [False, True] * (count // 2 + 1)][:count],
+        "find_github_url_with_llm": [threaded(find_github_url_with_llm, text)] * count,
+        "get_github_data": [lambda n=n: get_github_data(f"bench-user-{n}") for n in range(count)],
+        # The GraphQL backend (GITHUB_BACKEND=graphql) against the fake's /graphql endpoint
+        "get_github_data_graphql": [
+            lambda n=n: get_github_data_graphql(f"bench-user-{n}", JOB_DESCRIPTION, GITHUB_MAX_PROJECTS) for n in range(count)
+        ],
+        "evaluate_candidate": [threaded(evaluate_candidate, JOB_DESCRIPTION, parsed, github)] * count,
+    }
+    return {name: await _measure(calls, concurrency) for name, calls in scenarios.items()}
+
+
+def _compare(current: dict, baseline: dict) -> list[str]:
+    """One line per scenario present in both runs: throughput and p95 change."""
+    lines = []
+    for group in ("screen", "agents"):
+        for key, result in current.get(group, {}).items():
+            before = baseline.get(group, {}).get(key)
+            if not before:
+                continue
+            if group == "agents":
+                pairs = [(f"{key}/{name}", result[name], before.get(name)) for name in result]
+            else:
+                pairs = [(key, result, before)]
+            for label, now, then in pairs:
+                if not then or not then.get("throughput_per_s"):
+                    continue
+                throughput = (now["throughput_per_s"] / then["throughput_per_s"] - 1) * 100
+                p95 = (now["latency_ms"]["p95"] / then["latency_ms"]["p95"] - 1) * 100 if then["latency_ms"]["p95"] else 0.0
+                lines.append(f"{group:6} {label:45} throughput {throughput:+7.1f}%   p95 {p95:+7.1f}%")
+    return lines
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+async def _run(args, openai: FakeOpenAI, github: FakeGitHub) -> dict:
+    results = {"screen": {}, "agents": {}}
+    from app.services.github_client import close_github_client
+    from app.services.pdf_extractor import shutdown_pdf_pool
+
+    try:
+        if not args.skip_screen:
+            for batch_size in args.batch_sizes:
+                for concurrency in args.concurrency:
+                    key = f"batch={batch_size},concurrency={concurrency}"
+                    print(f"[screen] {key} ...", file=sys.stderr)
+                    results["screen"][key] = await bench_screen(args, batch_size, concurrency)
+        if not args.skip_agents:
+            for concurrency in args.concurrency:
+                key = f"concurrency={concurrency}"
+                print(f"[agents] {key} ...", file=sys.stderr)
+                results["agents"][key] = await bench_agents(args, concurrency)
+    finally:
+        await close_github_client()
+        shutdown_pdf_pool()
+
+    results["fake_servers"] = {
+        "openai_calls": openai.calls,
+        "openai_prompt_tokens": openai.prompt_tokens,
+        "github_requests": github.requests,
+        "github_not_modified": github.not_modified,
+        "github_rate_limited": github.rate_limited,
+    }
+    return results
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Offline SmartScan AI benchmarks.")
+    parser.add_argument("--batch-sizes", type=_int_list, default=[1, 8], help="resumes per /screen request")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4], help="requests / calls in flight")
+    parser.add_argument("--rounds", type=int, default=2, help="requests per scenario = concurrency x rounds")
+    parser.add_argument("--pages", type=int, default=1, help="pages per synthetic resume")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds added to every LLM call")
+    parser.add_argument("--llm-latency-per-1k", type=float, default=0.0, help="seconds added per 1000 prompt tokens")
+    parser.add_argument("--github-latency", type=float, default=0.01, help="seconds added to every GitHub request")
+    parser.add_argument("--repos", type=int, default=30, help="public repositories per fake GitHub user")
+    parser.add_argument("--readme-bytes", type=int, default=4000, help="README size of every fake repository")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="fake GitHub requests per token and hour")
+    parser.add_argument("--with-caches", action="store_true", help="keep the LLM, GitHub and resume caches enabled")
+    parser.add_argument("--skip-screen", action="store_true")
+    parser.add_argument("--skip-agents", action="store_true")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a previous --output file to compare against")
+    args = parser.parse_args(argv)
+
+    output = os.path.abspath(args.output) if args.output else None
+    compare = os.path.abspath(args.compare) if args.compare else None
+    openai = FakeOpenAI(latency=args.llm_latency, latency_per_1k_tokens=args.llm_latency_per_1k).start()
+    github = FakeGitHub(
+        repos=args.repos, readme_bytes=args.readme_bytes, latency=args.github_latency, rate_limit=args.rate_limit
+    ).start()
+
+    with tempfile.TemporaryDirectory(prefix="smartscan-bench-") as workdir:
+        cwd = os.getcwd()
+        _configure_environment(args, openai.base_url, github.base_url, workdir)
+        try:
+            started = time.time()
+            results = asyncio.run(_run(args, openai, github))
+        finally:
+            os.chdir(cwd)
+            openai.stop()
+            github.stop()
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started)),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        # ru_maxrss is in KiB on Linux and bytes on macOS
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if sys.platform == "darwin" else 2**10), 1),
+        **results,
+    }
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if compare:
+        with open(compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {compare}:")
+        for line in _compare(report, baseline) or ["(no matching scenarios)"]:
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
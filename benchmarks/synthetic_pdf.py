@@ -0,0 +1,74 @@
+# benchmarks/synthetic_pdf.py
+# Minimal resume PDFs (text + an optional GitHub link annotation) written by hand, so no PDF library is needed.
+import random
+
+FIRST_NAMES = ["Aisha", "Ben", "Carla", "Dev", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jonas", "Kavya", "Luis"]
+LAST_NAMES = ["Sharma", "Okafor", "Nguyen", "Schmidt", "Rossi", "Kim", "Silva", "Patel", "Novak", "Haddad"]
+SKILLS = [
+    "Python", "PyTorch", "TensorFlow", "scikit-learn", "NLP", "SQL", "Docker", "Kubernetes", "AWS",
+    "React", "Node.js", "Java", "C++", "Go", "FastAPI", "Django", "Pandas", "NumPy", "Git", "Linux",
+]
+FILLER = (
+    "Built and shipped features end to end, wrote tests and documentation, reviewed code and "
+    "worked closely with product and design to deliver measurable improvements."
+)
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list[list[str]], link: str | None = None) -> bytes:
+    """A PDF with one page per list of text lines; `link` becomes a URI link annotation on the first page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_refs = []
+    for page_number, lines in enumerate(pages):
+        content = "BT /F1 10 Tf 50 780 Td 13 TL " + " ".join(f"({_escape(line)}) Tj T*" for line in lines) + " ET"
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+        content_ref = len(objects)
+        annots = ""
+        if link and page_number == 0:
+            objects.append(
+                f"<< /Type /Annot /Subtype /Link /Rect [50 740 250 755] /Border [0 0 0] /A << /S /URI /URI ({_escape(link)}) >> >>"
+            )
+            annots = f"/Annots [{len(objects)} 0 R]"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {content_ref} 0 R"
+            f" /Resources << /Font << /F1 3 0 R >> >> {annots} >>"
+        )
+        page_refs.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {len(page_refs)} >>"
+
+    out = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out.encode("latin-1")))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out.encode("latin-1"))
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n" + "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return out.encode("latin-1")
+
+
+def make_resume(index: int, pages: int = 1, with_link: bool = True, seed: int = 0) -> tuple[str, bytes]:
+    """A deterministic synthetic resume: returns (filename, PDF bytes)."""
+    rng = random.Random(seed * 100003 + index)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    username = f"bench-user-{index}"
+    skills = rng.sample(SKILLS, 6)
+    first_page = [
+        name,
+        f"{username}@example.com | +1 555 {index:04d}",
+        f"GitHub: github.com/{username}" if with_link else "",
+        "",
+        "Skills: " + ", ".join(skills),
+        "",
+        "Experience",
+    ]
+    for job in range(3):
+        first_page.append(f"Software Engineer, Company {rng.randint(1, 99)} (20{rng.randint(15, 24)} - present)")
+        first_page.extend([FILLER[:90], FILLER[90:]])
+    first_page += ["", "Projects"] + [f"Project {p}: {skills[p % len(skills)]} service with {rng.randint(1, 50)}k users" for p in range(4)]
+    all_pages = [first_page] + [[f"Additional experience {page}", FILLER[:90], FILLER[90:]] * 8 for page in range(1, pages)]
+    link = f"https://github.com/{username}" if with_link else None
+    return f"resume_{index:04d}.pdf", make_pdf(all_pages, link)
@@ -14,83 +14,121 @@ st.write("An AI-powered tool to screen internship applications based on resumes
 # File uploader and job description input
 st.markdown("---")
 job_description = st.text_area("Job Description", height=200)
-resume_files = st.file_uploader("Upload Resumes (PDF)", type=["pdf"], accept_multiple_files=True)
+resume_files = st.file_uploader(
+    "Upload Resumes (PDFs, or a zip / tar archive of PDFs)",
+    type=["pdf", "zip", "tar", "gz", "tgz"],
+    accept_multiple_files=True,
+)
 
 # Define the FastAPI endpoint
-FASTAPI_URL = "http://127.0.0.1:8000/screen"
+FASTAPI_URL = "http://127.0.0.1:8000/screen/stream"
+
+
+def render_candidate(result):
+    """Renders one candidate card."""
+    with st.container(border=True):
+        eval_data = result.get('final_evaluation', {})
+        st.markdown(f"### {eval_data.get('candidate_name') or result.get('parsed_resume_data', {}).get('name') or result.get('filename', 'N/A')}")
+        ranking = result.get('prerank')
+        if ranking and not ranking.get('shortlisted'):
+            st.caption(f"Not shortlisted by the pre-ranking (rank {ranking['rank']}, score {ranking['score']}).")
+        score = eval_data.get('score', 'N/A')
+        
+        explanation = eval_data.get('explanation', {})
+        
+        if isinstance(score, (int, float)):
+            if score >= 8:
+                st.progress(score / 10, text=f"**Score:** :green[{score}/10]")
+            elif score >= 5:
+                st.progress(score / 10, text=f"**Score:** :orange[{score}/10]")
+            else:
+                st.progress(score / 10, text=f"**Score:** :red[{score}/10]")
+        else:
+            st.markdown(f"**Score:** {score}")
+        
+        if explanation:
+            with st.expander("Show Detailed Explanation"):
+                st.markdown("#### Strengths")
+                strengths = explanation.get("strengths", [])
+                for s in strengths:
+                    st.markdown(f"- {s}")
+                
+                st.markdown("#### Weaknesses")
+                weaknesses = explanation.get("weaknesses", [])
+                for w in weaknesses:
+                    st.markdown(f"- {w}")
+        else:
+            st.markdown("No detailed explanation available.")
+
 
 if st.button("Screen Candidates"):
     if not job_description:
         st.error("Please provide a job description.")
     elif not resume_files:
         st.error("Please upload at least one resume.")
+    elif sum(not resume.name.lower().endswith('.pdf') for resume in resume_files) > 1:
+        st.error("Please upload at most one archive.")
     else:
-        # The spinner will be shown, but the log messages are removed.
-        with st.spinner("Screening in progress..."):
-            files = [('resumes', resume) for resume in resume_files]
-            data = {'job_description': job_description}
-
-            try:
-                response = requests.post(FASTAPI_URL, files=files, data=data)
-
-                if response.status_code == 200:
-                    results = response.json().get("results", [])
-                    st.success("Screening complete!")
-                    st.markdown("---")
-
-                    # --- Correctly calculate the GitHub URL extraction accuracy ---
-                    total_resumes = len(results)
-                    correctly_found = sum(1 for r in results if r.get('parsed_resume_data', {}).get('github_url'))
-                    accuracy = (correctly_found / total_resumes) * 100
-                    
-                    st.markdown(f"### GitHub URL Extraction Accuracy: **{accuracy:.2f}%**")
-                    st.info(f"The agent correctly found **{correctly_found}** out of **{total_resumes}** GitHub URLs directly from the resumes.")
-                    st.markdown("---")
-
-                    # Display results
-                    st.subheader("Screening Results")
-
-                    results.sort(key=lambda x: x.get('final_evaluation', {}).get('score', 0), reverse=True)
-
-                    for result in results:
-                        with st.container(border=True):
-                            eval_data = result.get('final_evaluation', {})
-                            st.markdown(f"### {eval_data.get('candidate_name', 'N/A')}")
-                            score = eval_data.get('score', 'N/A')
-                            
-                            explanation = eval_data.get('explanation', {})
-                            
-                            if isinstance(score, (int, float)):
-                                if score >= 8:
-                                    st.progress(score / 10, text=f"**Score:** :green[{score}/10]")
-                                elif score >= 5:
-                                    st.progress(score / 10, text=f"**Score:** :orange[{score}/10]")
-                                else:
-                                    st.progress(score / 10, text=f"**Score:** :red[{score}/10]")
-                            else:
-                                st.markdown(f"**Score:** {score}")
-                            
-                            if explanation:
-                                with st.expander("Show Detailed Explanation"):
-                                    st.markdown("#### Strengths")
-                                    strengths = explanation.get("strengths", [])
-                                    for s in strengths:
-                                        st.markdown(f"- {s}")
-                                    
-                                    st.markdown("#### Weaknesses")
-                                    weaknesses = explanation.get("weaknesses", [])
-                                    for w in weaknesses:
-                                        st.markdown(f"- {w}")
-                            else:
-                                st.markdown("No detailed explanation available.")
-
-                else:
+        # Archives are unpacked on the server, one resume at a time
+        files = [
+            ('resumes' if resume.name.lower().endswith('.pdf') else 'archive', resume)
+            for resume in resume_files
+        ]
+        data = {'job_description': job_description}
+
+        progress_bar = st.progress(0.0, text="Screening in progress...")
+        summary_area = st.empty()
+        st.markdown("---")
+        st.subheader("Screening Results")
+        results_area = st.empty()
+        results = []
+
+        try:
+            # Candidates arrive one by one as the backend finishes them
+            with requests.post(FASTAPI_URL, files=files, data=data, stream=True) as response:
+                if response.status_code != 200:
                     st.error(f"Error from backend: {response.text}")
-                    # No status log to empty, so this is now redundant.
-
-            except requests.exceptions.RequestException as e:
-                st.error(f"Could not connect to the backend server. Is it running? Error: {e}")
-                # No status log to empty, so this is now redundant.
+                else:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        event = json.loads(line)
+
+                        if event["event"] in ("candidate", "failed"):
+                            if event["total"]:
+                                progress_bar.progress(
+                                    event["completed"] / event["total"],
+                                    text=f"Screened {event['completed']} of {event['total']} resumes..."
+                                )
+                            else:
+                                # The number of resumes in an archive is only known at the end
+                                progress_bar.progress(0.0, text=f"Screened {event['completed']} resumes...")
+                        if event["event"] == "candidate":
+                            results.append(event["data"])
+                            results.sort(key=lambda x: x.get('final_evaluation', {}).get('score', 0), reverse=True)
+                            with results_area.container():
+                                for result in results:
+                                    render_candidate(result)
+                        elif event["event"] == "failed":
+                            st.warning(f"Could not screen {event['filename']}.")
+                        elif event["event"] == "summary":
+                            progress_bar.progress(1.0, text=f"Screening complete in {event['elapsed_seconds']}s!")
+
+                    if results:
+                        # --- Correctly calculate the GitHub URL extraction accuracy ---
+                        total_resumes = len(results)
+                        correctly_found = sum(1 for r in results if r.get('parsed_resume_data', {}).get('github_url'))
+                        accuracy = (correctly_found / total_resumes) * 100
+
+                        with summary_area.container():
+                            st.success("Screening complete!")
+                            st.markdown(f"### GitHub URL Extraction Accuracy: **{accuracy:.2f}%**")
+                            st.info(f"The agent correctly found **{correctly_found}** out of **{total_resumes}** GitHub URLs directly from the resumes.")
+                    else:
+                        st.error("No candidates were successfully screened. Check the server logs for details.")
+
+        except requests.exceptions.RequestException as e:
+            st.error(f"Could not connect to the backend server. Is it running? Error: {e}")
 
 
 # # streamlit_app.py